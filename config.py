@@ -4,15 +4,20 @@ All tunable parameters in one place.
 """
 
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-load_dotenv()
+# Single-pass env snapshot: .env values overridden by the real environment.
+# All credential reads go through this dict instead of repeated os.getenv
+# calls (which hit libc getenv per lookup). The .env path is anchored to
+# this file, not the CWD, so launching from systemd/cron/anywhere works.
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+_ENV = {**dotenv_values(_ENV_FILE), **os.environ}
 
 
 # ─── 01 Exchange ────────────────────────────────────────────────────────────────
 
 O1_API_URL = "https://zo-mainnet.n1.xyz"
-O1_PRIVATE_KEY = os.getenv("O1_PRIVATE_KEY", "")
+O1_PRIVATE_KEY = _ENV.get("O1_PRIVATE_KEY", "")
 
 # BTC market on 01 Exchange
 O1_MARKET_ID = 0
@@ -21,10 +26,10 @@ O1_SYMBOL = "BTCUSD"
 
 # ─── Lighter DEX ────────────────────────────────────────────────────────────────
 
-LIGHTER_API_URL = os.getenv("LIGHTER_API_URL", "https://mainnet.zklighter.elliot.ai")
-LIGHTER_API_KEY_PRIVATE_KEY = os.getenv("LIGHTER_API_KEY_PRIVATE_KEY", "")
-LIGHTER_API_KEY_INDEX = int(os.getenv("LIGHTER_API_KEY_INDEX", "0"))
-LIGHTER_ACCOUNT_INDEX = int(os.getenv("LIGHTER_ACCOUNT_INDEX", "0"))
+LIGHTER_API_URL = _ENV.get("LIGHTER_API_URL", "https://mainnet.zklighter.elliot.ai")
+LIGHTER_API_KEY_PRIVATE_KEY = _ENV.get("LIGHTER_API_KEY_PRIVATE_KEY", "")
+LIGHTER_API_KEY_INDEX = int(_ENV.get("LIGHTER_API_KEY_INDEX", "0"))
+LIGHTER_ACCOUNT_INDEX = int(_ENV.get("LIGHTER_ACCOUNT_INDEX", "0"))
 
 # BTC market on Lighter
 LIGHTER_MARKET_ID = 1
@@ -40,6 +45,7 @@ COOLDOWN_MINUTES_RANGE = (3, 5)  # Min/Max cooldown minutes between cycles
 ORDER_TIMEOUT_S = 5 * 60     # Cancel unfilled OPEN limit after 5 minutes, retry
 CLOSE_REPRICE_S = 30         # Re-price close order every 30s to chase market
 CLOSE_BUFFER_USD = 20.0       # How far from BBO to place close order (dollars) -> Higher = safer maker, slower fill
+REPRICE_HYSTERESIS_USD = 1.0  # Ignore close-price moves smaller than this (skip cancel/replace on BBO jitter)
 SPREAD_OFFSET_BPS = 4        # Spread offset for opening orders (bps from Lighter mid)
 LEVERAGE = 40                # Max leverage used on exchanges (for margin calculations)
 
@@ -56,7 +62,11 @@ SESSION_DURATION_S = 3600     # 01 Exchange session expiry (1 hour)
 DRY_RUN = False               # Set True to log orders without sending
 HEDGE_SLIPPAGE_BPS = 10      # Max slippage for Lighter taker hedge (basis points)
 
+# Position-size thresholds (BTC) — shared by every "is flat / is dust" check
+FLAT_THRESHOLD_BTC = 1e-5    # Positions below this count as flat
+DUST_THRESHOLD_BTC = 5e-6    # Ignore scraps below ~500 sats when unwinding
+
 # ─── Telegram Bot ───────────────────────────────────────────────────────────────
 
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
-TELEGRAM_ALLOWED_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")  # Only allow commands from this ID
+TELEGRAM_BOT_TOKEN = _ENV.get("TELEGRAM_BOT_TOKEN", "")
+TELEGRAM_ALLOWED_CHAT_ID = _ENV.get("TELEGRAM_CHAT_ID", "")  # Only allow commands from this ID
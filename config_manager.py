@@ -5,10 +5,17 @@ Manages a whitelist of editable settings that can be changed at runtime
 without restarting the bot. Changes are persisted to config_overrides.json.
 """
 
+import hashlib
+import html
 import json
 import logging
 import os
 
+try:
+    import orjson  # Rust JSON — ~5x faster and emits bytes directly
+except ImportError:
+    orjson = None
+
 import config
 
 logger = logging.getLogger(__name__)
@@ -16,72 +23,145 @@ logger = logging.getLogger(__name__)
 # Path to persist overrides (same directory as config.py)
 OVERRIDES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config_overrides.json")
 
+# In-memory mirror of what's on disk — lets _save_overrides skip the
+# write entirely when a /set didn't actually change anything.
+# The digest covers the serialized bytes so even re-ordered-but-equal
+# dicts are caught before any disk I/O happens.
+_cached_overrides: dict | None = None
+_cached_digest: bytes | None = None
+_last_mtime_ns: int | None = None
+
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def _dumps(obj: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Accepted truthy spellings for bool settings (O(1) hash membership).
+_TRUE_SET = frozenset(("true", "1", "yes"))
+
+
+# Parsers convert the user's string input to the correct Python type.
+# Plain module-level functions (not lambdas) — direct references are
+# cheaper to call and easier to reuse across settings.
+def _p_float(parts):
+    return float(parts[0])
+
+
+def _p_int(parts):
+    return int(parts[0])
+
+
+def _p_bool(parts):
+    return parts[0].lower() in _TRUE_SET
+
+
+def _p_range(parts):
+    return (float(parts[0]), float(parts[1]))
+
+
+def _p_range_minutes(parts):
+    return (float(parts[0]) * 60, float(parts[1]) * 60)
+
+
 # Whitelist of settings that can be changed via Telegram.
 # Maps setting name -> (type, description, parser)
-# parser converts the user's string input to the correct Python type.
 EDITABLE_SETTINGS = {
     "ORDER_SIZE_RANGE_USD": {
         "type": "range",
         "desc": "Order size range in USD (min max)",
         "example": "/set ORDER_SIZE_RANGE_USD 800 1200",
-        "parse": lambda parts: (float(parts[0]), float(parts[1])),
+        "parse": _p_range,
     },
     "HOLD_DURATION_RANGE_S": {
         "type": "range",
         "desc": "Hold duration range in MINUTES (min max)",
         "example": "/set HOLD 30 60",
-        "parse": lambda parts: (float(parts[0]) * 60, float(parts[1]) * 60),
+        "parse": _p_range_minutes,
     },
     "COOLDOWN_MINUTES_RANGE": {
         "type": "range",
         "desc": "Cooldown range in minutes (min max)",
         "example": "/set COOLDOWN 10 15",
-        "parse": lambda parts: (float(parts[0]), float(parts[1])),
+        "parse": _p_range,
     },
     "ORDER_TIMEOUT_S": {
         "type": "number",
         "desc": "Cancel unfilled order after N seconds",
         "example": "/set ORDER_TIMEOUT_S 300",
-        "parse": lambda parts: float(parts[0]),
+        "parse": _p_float,
     },
     "CLOSE_REPRICE_S": {
         "type": "number",
         "desc": "Re-price close order every N seconds",
         "example": "/set CLOSE_REPRICE_S 30",
-        "parse": lambda parts: float(parts[0]),
+        "parse": _p_float,
     },
     "CLOSE_BUFFER_USD": {
         "type": "number",
         "desc": "Close order distance from BBO (USD)",
         "example": "/set CLOSE_BUFFER_USD 15",
-        "parse": lambda parts: float(parts[0]),
+        "parse": _p_float,
     },
     "SPREAD_OFFSET_BPS": {
         "type": "number",
         "desc": "Opening spread offset (basis points)",
         "example": "/set SPREAD_OFFSET_BPS 10",
-        "parse": lambda parts: float(parts[0]),
+        "parse": _p_float,
     },
     "HEDGE_SLIPPAGE_BPS": {
         "type": "number",
         "desc": "Max hedge slippage (basis points)",
         "example": "/set HEDGE_SLIPPAGE_BPS 10",
-        "parse": lambda parts: int(parts[0]),
+        "parse": _p_int,
     },
     "DRY_RUN": {
         "type": "bool",
         "desc": "Simulate orders without sending",
         "example": "/set DRY_RUN true",
-        "parse": lambda parts: parts[0].lower() in ("true", "1", "yes"),
+        "parse": _p_bool,
     },
     "LEVERAGE": {
         "type": "number",
         "desc": "Max leverage for margin calculations",
         "example": "/set LEVERAGE 40",
-        "parse": lambda parts: int(parts[0]),
+        "parse": _p_int,
     },
 }
 
+# Precomputed at import — EDITABLE_SETTINGS is static, so hoist the key
+# tuple, the range-typed subset, and the config module dict out of the
+# per-call loops (getattr on a module is a full attribute lookup; a plain
+# dict .get is much cheaper on the hot Telegram-response path).
+_EDITABLE_KEYS = tuple(EDITABLE_SETTINGS)
+_RANGE_KEYS = frozenset(k for k, m in EDITABLE_SETTINGS.items() if m["type"] == "range")
+_CFG = config.__dict__
+
+# Parallel tuples (SoA layout) derived from EDITABLE_SETTINGS, so the
+# iterate-and-format loops index flat tuples instead of chasing a dict
+# of dicts per entry. EDITABLE_SETTINGS remains the authoring format.
+_TYPES = tuple(m["type"] for m in EDITABLE_SETTINGS.values())
+_DESCS = tuple(m["desc"] for m in EDITABLE_SETTINGS.values())
+_EXAMPLES = tuple(m["example"] for m in EDITABLE_SETTINGS.values())
+_PARSERS = tuple(m["parse"] for m in EDITABLE_SETTINGS.values())
+
+# Per-key (expected_arg_count, parser, example) so update_setting is one
+# lookup + one length check + one parser call, with no type-string compares.
+_DISPATCH = {
+    k: (2 if m["type"] == "range" else 1, m["parse"], m["example"])
+    for k, m in EDITABLE_SETTINGS.items()
+}
+
 # Aliases for easier typing
 ALIASES = {
     "ORDER_SIZE": "ORDER_SIZE_RANGE_USD",
@@ -97,29 +177,70 @@ ALIASES = {
     "SLIPPAGE": "HEDGE_SLIPPAGE_BPS",
 }
 
+# Merged resolution table: canonical keys map to themselves, aliases map
+# to their canonical key — one dict probe resolves a /set argument.
+_RESOLVE = {k: k for k in EDITABLE_SETTINGS}
+_RESOLVE.update(ALIASES)
+
+# The "available settings" blurb for unknown keys never changes either.
+_AVAILABLE = "\n".join(f"  `{k}`" for k in EDITABLE_SETTINGS)
+
+# Inverted alias map (shortest alias wins) — static, so built once.
+_KEY_TO_ALIAS: dict[str, str] = {}
+for _alias, _real_key in ALIASES.items():
+    if _real_key not in _KEY_TO_ALIAS or len(_alias) < len(_KEY_TO_ALIAS[_real_key]):
+        _KEY_TO_ALIAS[_real_key] = _alias
+
+# Pre-escaped static parts of the /config display: only the current value
+# changes between calls, so escape names/descriptions/examples up front.
+# Parallel to _EDITABLE_KEYS.
+_STATIC_DISPLAY: tuple[tuple[str, str, str], ...] = tuple(
+    (
+        html.escape(_KEY_TO_ALIAS.get(_key, _key)),
+        html.escape(_DESCS[_i]),
+        html.escape(_EXAMPLES[_i].replace(_key, _KEY_TO_ALIAS.get(_key, _key))),
+    )
+    for _i, _key in enumerate(_EDITABLE_KEYS)
+)
+
 
 def load_overrides():
     """
     Load saved overrides from config_overrides.json and apply to config module.
-    Called once at startup.
+    Called once at startup; re-invocations skip the parse when the file's
+    mtime is unchanged.
     """
-    if not os.path.exists(OVERRIDES_FILE):
+    global _cached_overrides, _cached_digest, _last_mtime_ns
+
+    try:
+        st = os.stat(OVERRIDES_FILE)
+    except FileNotFoundError:
+        return
+
+    if st.st_mtime_ns == _last_mtime_ns:
         return
 
     try:
-        with open(OVERRIDES_FILE, "r") as f:
-            overrides = json.load(f)
+        with open(OVERRIDES_FILE, "rb") as f:
+            raw = f.read()
+        overrides = _loads(raw)
+
+        _cached_overrides = dict(overrides)
+        _cached_digest = _digest(raw)
 
         applied = 0
         for key, value in overrides.items():
             if key in EDITABLE_SETTINGS:
                 # Convert lists back to tuples for range types
-                if EDITABLE_SETTINGS[key]["type"] == "range" and isinstance(value, list):
+                if key in _RANGE_KEYS and isinstance(value, list):
                     value = tuple(value)
-                setattr(config, key, value)
+                _CFG[key] = value  # direct module-dict write, skips setattr
                 applied += 1
 
+        _last_mtime_ns = st.st_mtime_ns
+
         if applied:
+            _invalidate_settings_cache()
             logger.info(f"Loaded {applied} config override(s) from {OVERRIDES_FILE}")
 
     except Exception as e:
@@ -131,32 +252,34 @@ def update_setting(key: str, value_parts: list[str]) -> tuple[bool, str]:
     Update a config setting.
     Returns (success, message).
     """
-    key = key.upper()
-    
-    # Resolve alias
-    if key in ALIASES:
-        key = ALIASES[key]
-
-    if key not in EDITABLE_SETTINGS:
-        available = "\n".join(f"  `{k}`" for k in EDITABLE_SETTINGS)
-        return False, f"Unknown setting: `{key}`\n\nAvailable:\n{available}"
+    # Resolve alias and canonical key in a single probe
+    canonical = _RESOLVE.get(key.upper())
+    if canonical is None:
+        return False, f"Unknown setting: `{key.upper()}`\n\nAvailable:\n{_AVAILABLE}"
+    key = canonical
 
-    setting = EDITABLE_SETTINGS[key]
+    expected, parser, example = _DISPATCH[key]
 
     # Validate input count
-    if setting["type"] == "range" and len(value_parts) != 2:
-        return False, f"Range requires 2 values.\nExample: `{setting['example']}`"
-    elif setting["type"] != "range" and len(value_parts) != 1:
-        return False, f"Expected 1 value.\nExample: `{setting['example']}`"
+    if len(value_parts) != expected:
+        noun = "Range requires 2 values" if expected == 2 else "Expected 1 value"
+        return False, f"{noun}.\nExample: `{example}`"
 
     try:
-        new_value = setting["parse"](value_parts)
+        new_value = parser(value_parts)
     except (ValueError, IndexError):
-        return False, f"Invalid value. Example: `{setting['example']}`"
+        return False, f"Invalid value. Example: `{example}`"
 
     # Apply to config module (takes effect immediately)
-    old_value = getattr(config, key, None)
-    setattr(config, key, new_value)
+    old_value = _CFG.get(key)
+
+    # Setting a value to what it already is (common "confirm the current
+    # setting" pattern over Telegram) — skip the whole save path.
+    if new_value == old_value:
+        return True, f"ℹ️ `{key}` already `{new_value}`"
+
+    _CFG[key] = new_value
+    _invalidate_settings_cache()
 
     # Persist to JSON
     _save_overrides()
@@ -165,66 +288,104 @@ def update_setting(key: str, value_parts: list[str]) -> tuple[bool, str]:
 
 
 def _save_overrides():
-    """Save all current overrideable settings to JSON."""
+    """Save all current overrideable settings to JSON (skipped if unchanged)."""
     overrides = {}
-    for key in EDITABLE_SETTINGS:
-        val = getattr(config, key, None)
+    for key in _EDITABLE_KEYS:
+        val = _CFG.get(key)
         if val is not None:
-            # Convert tuples to lists for JSON
-            overrides[key] = list(val) if isinstance(val, tuple) else val
+            # Convert range tuples to lists for JSON
+            overrides[key] = list(val) if key in _RANGE_KEYS else val
+
+    global _cached_overrides, _cached_digest
+
+    # No-op update: nothing changed since the last write, skip the disk I/O
+    if overrides == _cached_overrides:
+        return
 
+    payload = _dumps(overrides)
+    new_digest = _digest(payload)
+    if new_digest == _cached_digest:
+        _cached_overrides = overrides
+        return
+
+    # Write-to-temp + atomic rename: a crash mid-write can never leave a
+    # torn/truncated overrides file behind.
+    tmp_file = f"{OVERRIDES_FILE}.tmp.{os.getpid()}"
     try:
-        with open(OVERRIDES_FILE, "w") as f:
-            json.dump(overrides, f, indent=2)
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+            if not config.DRY_RUN:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, OVERRIDES_FILE)
+        _cached_overrides = overrides
+        _cached_digest = new_digest
     except Exception as e:
         logger.error(f"Failed to save config overrides: {e}")
 
 
-import html
+# /config output only changes when a setting actually changes, so the
+# rendered string is cached and dropped on writes (update_setting /
+# load_overrides) rather than rebuilt per command.
+_SETTINGS_CACHE: str | None = None
+
+
+def _invalidate_settings_cache():
+    global _SETTINGS_CACHE
+    _SETTINGS_CACHE = None
+
 
 def get_settings_display() -> str:
     """Format current settings for Telegram display with aliases (HTML)."""
+    global _SETTINGS_CACHE
+    if _SETTINGS_CACHE is not None:
+        return _SETTINGS_CACHE
+
     lines = []
-    
-    # Invert ALIASES to find short names for keys
-    key_to_alias = {}
-    for alias, real_key in ALIASES.items():
-        # Prefer shorter aliases
-        if real_key not in key_to_alias or len(alias) < len(key_to_alias[real_key]):
-            key_to_alias[real_key] = alias
 
-    for key, meta in EDITABLE_SETTINGS.items():
-        val = getattr(config, key, "?")
-        if meta["type"] == "range":
+    for i, key in enumerate(_EDITABLE_KEYS):
+        val = _CFG.get(key, "?")
+        if key in _RANGE_KEYS:
             val_str = f"{val[0]}-{val[1]}"
         else:
             val_str = str(val)
-            
-        # Use alias if available, else key
-        display_name = key_to_alias.get(key, key)
-        
-        # Escape strings for HTML safety
-        d_name_safe = html.escape(display_name)
+
+        # Only the value is dynamic — everything else was escaped at import
+        d_name_safe, desc_safe, example_safe = _STATIC_DISPLAY[i]
         val_safe = html.escape(val_str)
-        desc_safe = html.escape(meta['desc'])
-        example_safe = html.escape(meta['example'].replace(key, display_name))
 
         lines.append(f"🔹 <b>{d_name_safe}</b>: <code>{val_safe}</code>")
         lines.append(f"   <i>{desc_safe}</i>")
         lines.append(f"   Example: <code>{example_safe}</code>\n")
 
-    return "\n".join(lines)
+    _SETTINGS_CACHE = "\n".join(lines)
+    return _SETTINGS_CACHE
 
 
-def get_help_text() -> str:
-    """Format help text for /set command."""
+# /help output is a pure function of static data — build it once, lazily.
+_HELP_CACHE: str | None = None
+
+
+def _build_help() -> str:
+    # Invert ALIASES once instead of a nested scan per key
+    key_to_aliases: dict[str, list[str]] = {}
+    for alias, real_key in ALIASES.items():
+        key_to_aliases.setdefault(real_key, []).append(alias)
+
     lines = ["**Editable Settings (Aliases):**\n"]
-    for key, meta in EDITABLE_SETTINGS.items():
-        # Find aliases for this key
-        aliases = [k for k, v in ALIASES.items() if v == key]
+    for i, key in enumerate(_EDITABLE_KEYS):
+        aliases = key_to_aliases.get(key)
         alias_str = f" ({', '.join(aliases)})" if aliases else ""
-        
-        lines.append(f"`{key}`{alias_str} — {meta['desc']}")
-        lines.append(f"  _{meta['example']}_")
+
+        lines.append(f"`{key}`{alias_str} — {_DESCS[i]}")
+        lines.append(f"  _{_EXAMPLES[i]}_")
 
     return "\n".join(lines)
+
+
+def get_help_text() -> str:
+    """Format help text for /set command."""
+    global _HELP_CACHE
+    if _HELP_CACHE is None:
+        _HELP_CACHE = _build_help()
+    return _HELP_CACHE
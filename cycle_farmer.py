@@ -12,14 +12,47 @@ import asyncio
 import time
 import logging
 import random
+from collections import deque
+from dataclasses import dataclass
 
 import config
-from exchange_01 import Exchange01Client
+from exchange_01 import Exchange01Client, MarginError, PostOnlyError, RiskError
 from lighter_client import LighterClient
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CyclePlan:
+    """
+    Per-cycle parameters, drawn once before the cycle starts.
+
+    Randomization and sizing happen up front instead of inside each phase,
+    so the phases themselves are pure executors and a whole cycle is
+    reproducible from its plan.
+    """
+    target_usd: float
+    target_size: float      # BTC
+    hold_s: float
+    cooldown_mins: float
+
+
+# Cycle summary, logged once per cycle. Built as a %-template so the
+# string only materializes when INFO is enabled.
+_CYCLE_SUMMARY_TMPL = (
+    "\n" + "─" * 40 + "\n"
+    "  Cycle %d Complete\n"
+    "  Opened: %s %.5f BTC @ $%.1f\n"
+    "  Volume generated: $%.2f\n"
+    + "─" * 40
+)
+
+
+def _flipped(a: float, b: float, tol: float) -> bool:
+    """True if position b crossed to the opposite sign of a (beyond tol)."""
+    return a * b < 0 and abs(b) > tol
+
+
 class CycleFarmer:
     """
     Delta Neutral Cycle Farmer.
@@ -71,9 +104,31 @@ class CycleFarmer:
 
         self.cycle_count = 0
         self._running = False
+        self._stop_event = asyncio.Event()  # set on shutdown to break long waits
         self._enabled = True  # Controlled by Telegram (True=Farm, False=Pause after cycle)
         self.alert_callback = None  # Set by TelegramBot for push alerts
 
+        # Fill events (position deltas on 01) pushed by the fill watcher.
+        # Consumers await the queue instead of polling REST themselves.
+        self._fill_events: asyncio.Queue = asyncio.Queue()
+        self._cancel_task: asyncio.Task | None = None  # in-flight cancel of the unfilled side
+        self._open_watcher: asyncio.Task | None = None  # fill watcher kept alive for the dual-fill check
+
+        # Hedge pipeline: fill deltas are enqueued and a dedicated worker
+        # issues the Lighter takers, so hedging overlaps fill detection.
+        self._hedge_queue: asyncio.Queue = asyncio.Queue()
+        self._hedge_failed = False
+
+        # In-flight partial-close unwinds, fired off without awaiting so the
+        # close chase loop keeps repricing. Reconciled in _phase_unwinding.
+        self._pending_unwinds: set[asyncio.Task] = set()
+        self._lighter_unwound_so_far = 0.0  # BTC hedged back during this close
+
+        # Dedicated RNG (seedable for reproducible replays) with batched
+        # draw buffers, keyed by parameter name.
+        self._rng = random.Random()
+        self._rand_bufs: dict[str, tuple[tuple, deque]] = {}
+
     async def run(self):
         """Main entry point."""
         logger.info("=" * 60)
@@ -94,7 +149,7 @@ class CycleFarmer:
     async def _initialize(self):
         """Initialize both exchange clients."""
         logger.info("─── Initializing 01 Exchange ───")
-        self.o1.initialize()
+        await self.o1.initialize()
 
         logger.info("─── Initializing Lighter DEX ───")
         await self.lighter.initialize()
@@ -102,8 +157,8 @@ class CycleFarmer:
         logger.info("─── Initialization Complete ───\n")
 
         # Check for existing unexpected positions
-        pos_01 = self.o1.get_position()
-        if abs(pos_01) > 0.00001:
+        pos_01 = await self.o1.get_position()
+        if abs(pos_01) > config.FLAT_THRESHOLD_BTC:
             logger.warning("⚠️" * 30)
             logger.warning(
                 f" DETECTED EXISTING 01 POSITION: {pos_01:.5f} BTC "
@@ -119,7 +174,7 @@ class CycleFarmer:
 
         # Check for existing Lighter positions
         pos_lighter = await self.lighter.get_position()
-        if abs(pos_lighter) > 0.00001:
+        if abs(pos_lighter) > config.FLAT_THRESHOLD_BTC:
             logger.warning("⚠️" * 30)
             logger.warning(
                 f" DETECTED EXISTING LIGHTER POSITION: {pos_lighter:.5f} BTC "
@@ -131,7 +186,7 @@ class CycleFarmer:
 
         # Capture Start Equity for Session PnL
         try:
-            bal_01 = self.o1.get_balance()
+            bal_01 = await self.o1.get_balance()
             self.start_equity_01 = bal_01.get("equity", 0.0)
             
             bal_lighter = await self.lighter.get_balance()
@@ -145,10 +200,14 @@ class CycleFarmer:
             logger.error(f"Failed to capture start equity: {e}")
 
     async def _send_alert(self, message: str):
-        """Send alert via Telegram callback (if set), otherwise just log."""
+        """Queue an alert via the Telegram callback (if set).
+
+        The callback is synchronous — it only enqueues, so alerting from
+        the trading path never waits on Telegram I/O.
+        """
         if self.alert_callback:
             try:
-                await self.alert_callback(message)
+                self.alert_callback(message)
             except Exception as e:
                 logger.error(f"Failed to send Telegram alert: {e}")
 
@@ -172,12 +231,14 @@ class CycleFarmer:
 
             try:
                 # ── Pre-cycle Balance Check ──
-                # Check 01 Exchange
-                bal_01 = self.o1.get_balance()
+                # Three independent round-trips — overlap them on the wire
+                # so the cycle pays max(RTT) instead of the sum.
+                bal_01, bal_lighter, (lighter_bid, lighter_ask) = await asyncio.gather(
+                    self.o1.get_balance(),
+                    self.lighter.get_balance(),
+                    self.lighter.get_best_bid_ask(),
+                )
                 free_col_01 = bal_01["free_collateral"]
-                
-                # Check Lighter DEX
-                bal_lighter = await self.lighter.get_balance()
                 free_col_lighter = bal_lighter["free_collateral"]
 
                 # Margin needed = order_size / leverage, with 50% safety buffer
@@ -211,17 +272,21 @@ class CycleFarmer:
 
                 # ── Fill Accumulation Loop ──
                 # Keep placing orders + hedging partials until full target is filled.
-                lighter_bid, lighter_ask = await self.lighter.get_best_bid_ask()
                 if lighter_bid <= 0 or lighter_ask <= 0:
                     logger.error("Cannot fetch Lighter BBO — skipping cycle")
                     await asyncio.sleep(10)
                     continue
 
                 lighter_mid = (lighter_bid + lighter_ask) / 2
-                # Randomize size for this cycle
-                target_usd = random.uniform(*config.ORDER_SIZE_RANGE_USD)
-                target_size = round(target_usd / lighter_mid, 5)
-                
+                # Draw the whole cycle's randomized parameters up front
+                plan = CyclePlan(
+                    target_usd=(target_usd := self._draw_uniform("size_usd", config.ORDER_SIZE_RANGE_USD)),
+                    target_size=round(target_usd / lighter_mid, 5),
+                    hold_s=self._draw_uniform("hold_s", config.HOLD_DURATION_RANGE_S),
+                    cooldown_mins=self._draw_uniform("cooldown_m", config.COOLDOWN_MINUTES_RANGE),
+                )
+                target_size = plan.target_size
+
                 total_filled = 0.0
                 fill_attempts = 0
                 max_attempts = 10  # Keep trying to fill large positions
@@ -232,7 +297,6 @@ class CycleFarmer:
                 )
 
                 while total_filled < target_size * 0.95 and self._running and self._enabled:
-                    remaining = round(target_size - total_filled, 5)
                     fill_attempts += 1
 
                     if fill_attempts > max_attempts:
@@ -242,23 +306,10 @@ class CycleFarmer:
                         )
                         break
 
-                    if fill_attempts > 1:
-                        side_str = locked_side.upper() if locked_side else "EITHER"
-                        logger.info(
-                            f"📋 Placing remainder: {remaining:.5f} BTC "
-                            f"(locked to {side_str}, "
-                            f"filled {total_filled:.5f} / {target_size:.5f})"
-                        )
-
-                    # Phase 1: Open (locked_side ensures same direction)
-                    filled = await self._phase_opening(remaining, locked_side)
+                    # Phase 1: Open (both sides — first fill locks direction)
+                    filled = await self._phase_opening(target_size, locked_side)
                     if not filled:
-                        self._cancel_open_orders()  # Safety: ensure no orphaned orders
-                        if total_filled > 0:
-                            logger.info(
-                                f"No more fills — proceeding with {total_filled:.5f} BTC"
-                            )
-                            break
+                        await self._cancel_open_orders()  # Safety: ensure no orphaned orders
                         continue  # Nothing at all, retry the cycle
 
                     # Lock to the side of the first fill
@@ -268,7 +319,20 @@ class CycleFarmer:
 
                     # Phase 2: Hedge this fill immediately
                     hedged = await self._phase_hedging()
+
+                    # Reconcile the pipelined cancel before reading position
+                    # again (orders may have been auto-killed on fill).
+                    if self._cancel_task:
+                        try:
+                            await self._cancel_task
+                        except Exception:
+                            pass
+                        self._cancel_task = None
+
                     if not hedged:
+                        if self._open_watcher:
+                            self._open_watcher.cancel()
+                            self._open_watcher = None
                         logger.error("❌ HEDGE FAILED — emergency close. PAUSING BOT.")
                         await self._emergency_close()
                         self._enabled = False  # Critical: Stop farming
@@ -278,13 +342,24 @@ class CycleFarmer:
                     hedged_size = self.open_size
 
                     # Corrective hedge: check for dual-fill race
-                    # (other side may have filled between detection and cancel)
-                    await asyncio.sleep(1)
-                    settled_pos = self.o1.get_position()
-                    settled_delta = abs(settled_pos - self._pre_open_pos)
-                    correction = round(settled_delta - hedged_size, 5)
-
-                    if correction > 0.00001:
+                    # (other side may have filled between detection and cancel).
+                    # Wait on the fill stream instead of a blind settle sleep —
+                    # returns the moment a late fill lands, or after 1s if none.
+                    correction = 0.0
+                    try:
+                        extra = await asyncio.wait_for(
+                            self._fill_events.get(), timeout=1.0
+                        )
+                        sign = 1.0 if self.open_side == "bid" else -1.0
+                        correction = round(sign * extra, 5)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        if self._open_watcher:
+                            self._open_watcher.cancel()
+                            self._open_watcher = None
+
+                    if correction > config.FLAT_THRESHOLD_BTC:
                         logger.info(
                             f"🔧 Corrective hedge: {correction:.5f} BTC "
                             f"(dual-fill detected)"
@@ -302,14 +377,31 @@ class CycleFarmer:
                         f"({total_filled/target_size*100:.0f}%)"
                     )
 
-                if total_filled < 0.00001 or not self._running:
-                    continue  # Nothing filled, try again
+                    # Any remainder rides ONE long-lived resting order —
+                    # no per-attempt re-entry into _phase_opening.
+                    if (
+                        total_filled < target_size * 0.95
+                        and self._running and self._enabled
+                    ):
+                        total_filled = await self._accumulate_remainder(
+                            target_size, total_filled, locked_side
+                        )
+                    break
+
+                # _enabled can drop inside _accumulate_remainder when a hedge
+                # fails and both legs get emergency-closed — don't carry the
+                # (already flattened) fill total into HOLDING.
+                if (
+                    total_filled < config.FLAT_THRESHOLD_BTC
+                    or not self._running or not self._enabled
+                ):
+                    continue  # Nothing filled (or pausing), try again
 
                 # Update open_size to total accumulated for closing/unwinding
                 self.open_size = total_filled
 
                 # Phase 3: Hold
-                await self._phase_holding()
+                await self._phase_holding(plan.hold_s)
                 if not self._running:
                     break
 
@@ -322,7 +414,7 @@ class CycleFarmer:
                 await self._phase_unwinding()
 
                 # Phase 6: Cooldown
-                await self._phase_cooldown()
+                await self._phase_cooldown(plan.cooldown_mins)
 
             except Exception as e:
                 logger.error(f"Cycle error: {e}", exc_info=True)
@@ -333,6 +425,36 @@ class CycleFarmer:
 
         logger.info("Cycle loop ended.")
 
+    # ─── Fill Watcher ────────────────────────────────────────────────────────
+
+    async def _watch_o1_fills(self, initial_pos: float):
+        """
+        Watch the 01 position and push fill deltas into _fill_events.
+
+        The 01 API used here is REST-only, so this task centralizes the
+        position polling in one place; phase coroutines just await queue
+        events and can be rewired to a WS user stream without changes.
+        """
+        last = initial_pos
+        poll_s = config.POLL_INTERVAL_S
+        flat = config.FLAT_THRESHOLD_BTC
+        while True:
+            await asyncio.sleep(poll_s)
+            try:
+                pos = await self.o1.get_position()
+            except Exception as e:
+                logger.debug(f"Fill watcher read failed: {e}")
+                continue
+            delta = pos - last
+            if abs(delta) > flat:
+                last = pos
+                await self._fill_events.put(delta)
+
+    def _drain_fill_events(self):
+        """Discard stale fill events from a previous attempt."""
+        while not self._fill_events.empty():
+            self._fill_events.get_nowait()
+
     # ─── Phase 1: OPENING ────────────────────────────────────────────────────
 
     async def _phase_opening(self, size: float = None, locked_side: str = None) -> bool:
@@ -363,7 +485,7 @@ class CycleFarmer:
         # SAFETY: Check 01 BBO to ensure we don't cross the book (Post-Only fail)
         # If our calculated price crosses the existing book, clamp it to "Join" or "Improve" without taking.
         try:
-            o1_bid, o1_ask = self.o1.get_best_bid_ask()
+            o1_bid, o1_ask = await self.o1.get_best_bid_ask()
             tick_size = 0.1  # BTCUSD on 01 usually 0.1 tick
 
             if o1_ask > 0 and bid_price >= o1_ask:
@@ -384,14 +506,14 @@ class CycleFarmer:
                     f"📋 OPENING | Lighter BBO: ${lighter_bid:,.1f} / ${lighter_ask:,.1f}\n"
                     f"   Placing on 01: BID ${bid_price:,.1f} × {self.open_size:.5f} BTC"
                 )
-                self.bid_order_id = self.o1.place_limit_order("bid", bid_price, self.open_size, post_only=True)
+                self.bid_order_id = await self.o1.place_limit_order("bid", bid_price, self.open_size, post_only=True)
                 self.ask_order_id = None
             elif locked_side == "ask":
                 logger.info(
                     f"📋 OPENING | Lighter BBO: ${lighter_bid:,.1f} / ${lighter_ask:,.1f}\n"
                     f"   Placing on 01: ASK ${ask_price:,.1f} × {self.open_size:.5f} BTC"
                 )
-                self.ask_order_id = self.o1.place_limit_order("ask", ask_price, self.open_size, post_only=True)
+                self.ask_order_id = await self.o1.place_limit_order("ask", ask_price, self.open_size, post_only=True)
                 self.bid_order_id = None
             else:
                 logger.info(
@@ -399,52 +521,55 @@ class CycleFarmer:
                     f"   Placing on 01: BID ${bid_price:,.1f} / ASK ${ask_price:,.1f} "
                     f"× {self.open_size:.5f} BTC"
                 )
-                # Place each side independently — if one fails POST_ONLY, keep the other
+                # Submit both sides in ONE signed atomic request so the ask
+                # doesn't trail the bid by a full REST round-trip.
                 try:
-                    self.bid_order_id = self.o1.place_limit_order("bid", bid_price, self.open_size, post_only=True)
-                except Exception as bid_err:
-                    if "POST_ONLY" in str(bid_err):
+                    new_ids = await self.o1.atomic_cancel_and_place(
+                        [],
+                        [
+                            {"side": "bid", "price": bid_price, "size": self.open_size, "post_only": True},
+                            {"side": "ask", "price": ask_price, "size": self.open_size, "post_only": True},
+                        ],
+                    )
+                    self.bid_order_id = new_ids[0] if len(new_ids) > 0 else None
+                    self.ask_order_id = new_ids[1] if len(new_ids) > 1 else None
+                except PostOnlyError:
+                    # One leg crossed the book and sank the batch — fall back
+                    # to independent placement so the passive side still rests.
+                    logger.warning("⚠️ Atomic open rejected (Post-Only). Placing sides independently.")
+                    try:
+                        self.bid_order_id = await self.o1.place_limit_order("bid", bid_price, self.open_size, post_only=True)
+                    except PostOnlyError:
                         logger.warning(f"⚠️ BID crossed book (Post-Only). Skipping bid side.")
                         self.bid_order_id = None
-                    else:
-                        raise
-                
-                try:
-                    self.ask_order_id = self.o1.place_limit_order("ask", ask_price, self.open_size, post_only=True)
-                except Exception as ask_err:
-                    if "POST_ONLY" in str(ask_err):
+
+                    try:
+                        self.ask_order_id = await self.o1.place_limit_order("ask", ask_price, self.open_size, post_only=True)
+                    except PostOnlyError:
                         logger.warning(f"⚠️ ASK crossed book (Post-Only). Skipping ask side.")
                         self.ask_order_id = None
-                    else:
-                        raise
-                
+
                 # If BOTH sides failed, wait and retry
                 if self.bid_order_id is None and self.ask_order_id is None:
                     logger.warning("⚠️ Both sides crossed book. Waiting 3s before retry...")
                     await asyncio.sleep(3)
                     return False
-        except Exception as e:
-            error_str = str(e)
-            
-            # 1. Post-Only Error: Price crossed book (Transient). Retry with delay.
-            if "POST_ONLY" in error_str:
-                self._cancel_open_orders()
-                logger.warning(f"⚠️ Limit order crossed book (Post-Only). Waiting 2s before retry...")
-                await asyncio.sleep(2)
-                return False
+        # 1. Post-Only Error: Price crossed book (Transient). Retry with delay.
+        except PostOnlyError:
+            await self._cancel_open_orders()
+            logger.warning(f"⚠️ Limit order crossed book (Post-Only). Waiting 2s before retry...")
+            await asyncio.sleep(2)
+            return False
 
-            # 2. Critical Errors: Margin, Risk, Unhealthy. Pause bot.
-            elif "RISK" in error_str or "UNHEALTHY" in error_str or "MARGIN" in error_str.upper():
-                self._cancel_open_orders()
-                msg = f"⚠️ MARGIN ERROR: {error_str}. Insufficient collateral — pausing bot."
-                logger.warning(msg)
-                await self._send_alert(msg)
-                self._enabled = False
-                return False
-            
-            # 3. Other errors: Re-raise
-            else:
-                raise
+        # 2. Critical Errors: Margin, Risk, Unhealthy. Pause bot.
+        # (Other errors propagate to the cycle-level handler.)
+        except (MarginError, RiskError) as e:
+            await self._cancel_open_orders()
+            msg = f"⚠️ MARGIN ERROR: {e}. Insufficient collateral — pausing bot."
+            logger.warning(msg)
+            await self._send_alert(msg)
+            self._enabled = False
+            return False
 
         if config.DRY_RUN:
             self.open_side = "bid"
@@ -452,68 +577,91 @@ class CycleFarmer:
             logger.info(f"[DRY RUN] Simulating bid fill @ ${bid_price:,.1f}")
             return True
 
-        # Poll for fills — re-price periodically to chase market
-        start_time = time.time()
+        # Wait for fills — event-driven via the fill watcher task.
+        start_time = time.monotonic()
         last_reprice_time = start_time
-        initial_pos = self.o1.get_position()
+        initial_pos = await self.o1.get_position()
 
+        self._drain_fill_events()
+        watcher = asyncio.create_task(self._watch_o1_fills(initial_pos))
+        filled = False
+        try:
+            filled = await self._await_open_fill(
+                initial_pos, start_time, last_reprice_time,
+                bid_price, ask_price, locked_side,
+            )
+            return filled
+        finally:
+            if filled:
+                # Keep the watcher alive: _run_cycles consumes any late
+                # dual-fill event from the stream, then cancels it.
+                self._open_watcher = watcher
+            else:
+                watcher.cancel()
+
+    async def _await_open_fill(
+        self, initial_pos, start_time, last_reprice_time,
+        bid_price, ask_price, locked_side,
+    ) -> bool:
+        """Consume fill events until a fill, timeout, or shutdown."""
+        # Snapshot hot-loop config once — LOAD_FAST per tick instead of a
+        # module-dict LOAD_ATTR (changes via /set apply on next entry)
+        poll_s = config.POLL_INTERVAL_S
+        timeout_s = config.ORDER_TIMEOUT_S
+        reprice_s = config.CLOSE_REPRICE_S
+        spread_frac = config.SPREAD_OFFSET_BPS / 10000
+        mono = time.monotonic  # one attr lookup, not one per tick
+
+        next_status = start_time + 30
         while self._running:
-            await asyncio.sleep(config.POLL_INTERVAL_S)
-            now = time.time()
-            elapsed = now - start_time
+            try:
+                delta = await asyncio.wait_for(
+                    self._fill_events.get(), timeout=poll_s
+                )
+            except asyncio.TimeoutError:
+                delta = 0.0
 
-            # Check position change FIRST (before timeout)
-            current_pos = self.o1.get_position()
-            delta = current_pos - initial_pos
+            now = mono()
+            elapsed = now - start_time
 
-            if abs(delta) > 0.00001:
-                # Cancel ALL orders immediately to prevent further fills
-                logger.info("Fill detected! Cancelling remaining orders...")
-                self._cancel_open_orders()
-                
-                # Wait briefly for cancels to process and any in-flight fills to settle
-                await asyncio.sleep(1)
-                
-                # RE-CHECK position to get the FINAL size to hedge
-                final_pos = self.o1.get_position()
-                final_delta = final_pos - initial_pos
-                
-                if abs(final_delta) > 0.00001:
-                    if final_delta > 0:
-                        self.open_side = "bid"
-                        self.open_price = bid_price
-                    else:
-                        self.open_side = "ask"
-                        self.open_price = ask_price
+            if delta:
+                # Claim the fill from the event itself and fire the cancel of
+                # the remaining orders CONCURRENTLY with the hedge — the
+                # Lighter taker no longer waits for the 01 cancel round-trip.
+                # Any dual-fill that lands during the race is picked up by the
+                # corrective-hedge check in _run_cycles.
+                logger.info("Fill detected! Cancelling remaining orders (pipelined)...")
+                if delta > 0:
+                    self.open_side = "bid"
+                    self.open_price = bid_price
+                else:
+                    self.open_side = "ask"
+                    self.open_price = ask_price
 
-                    # Hedge EXACTLY the final delta we are exposed to
-                    self.open_size = abs(final_delta)
-                    self._pre_open_pos = initial_pos  # Save for correction check
+                self.open_size = abs(delta)
+                self._pre_open_pos = initial_pos  # Save for correction check
+                self._cancel_task = asyncio.create_task(self._cancel_open_orders())
 
-                    msg = (
-                        f"🔔 FILL! {self.open_side.upper()} {self.open_size:.5f} BTC "
-                        f"@ ~${self.open_price:,.1f} on 01"
-                    )
-                    logger.info(msg)
-                    await self._send_alert(msg)
+                msg = (
+                    f"🔔 FILL! {self.open_side.upper()} {self.open_size:.5f} BTC "
+                    f"@ ~${self.open_price:,.1f} on 01"
+                )
+                logger.info(msg)
+                await self._send_alert(msg)
 
-                    return True
-                else:
-                    # Rare: The fill reversed or was anomalous, resume loop
-                    logger.warning("Fill vanished after cancel wait. Resuming...")
-                    return False
+                return True
 
             # THEN check timeout
-            if elapsed > config.ORDER_TIMEOUT_S:
-                logger.warning(f"⏰ No fill after {config.ORDER_TIMEOUT_S}s — cancelling")
-                self._cancel_open_orders()
+            if elapsed > timeout_s:
+                logger.warning(f"⏰ No fill after {timeout_s}s — cancelling")
+                await self._cancel_open_orders()
 
                 # Final position check for partial fills
                 await asyncio.sleep(1)
-                final_pos = self.o1.get_position()
+                final_pos = await self.o1.get_position()
                 final_delta = final_pos - initial_pos
 
-                if abs(final_delta) > 0.00001:
+                if abs(final_delta) > config.FLAT_THRESHOLD_BTC:
                     if final_delta > 0:
                         self.open_side = "bid"
                         self.open_price = bid_price
@@ -534,58 +682,229 @@ class CycleFarmer:
 
             # Re-price remainder orders only (locked side, single order)
             # Initial bid+ask don't need re-pricing — one side will get hit
-            if locked_side is not None and now - last_reprice_time >= config.CLOSE_REPRICE_S:
+            if locked_side is not None and now - last_reprice_time >= reprice_s:
                 lighter_bid_new, lighter_ask_new = await self.lighter.get_best_bid_ask()
                 if lighter_bid_new > 0 and lighter_ask_new > 0:
                     lighter_mid_new = (lighter_bid_new + lighter_ask_new) / 2
-                    offset_new = lighter_mid_new * (config.SPREAD_OFFSET_BPS / 10000)
+                    offset_new = lighter_mid_new * spread_frac
 
                     if locked_side == "bid":
                         new_price = round(lighter_bid_new - offset_new, 1)
                         if new_price != bid_price:
-                            try:
-                                # Cancel old first
-                                if self.bid_order_id:
-                                    try:
-                                        self.o1.cancel_order(self.bid_order_id)
-                                    except: pass
-                                
+                            new_id = await self._reprice_order(
+                                "bid", self.bid_order_id, new_price, elapsed
+                            )
+                            if new_id is not None:
                                 bid_price = new_price
-                                self.bid_order_id = self.o1.place_limit_order("bid", bid_price, self.open_size, post_only=True)
-                                logger.info(f"   🔄 Re-priced remainder: BID ${bid_price:,.1f} ({elapsed:.0f}s)")
-                            except Exception as e:
-                                if "POST_ONLY" in str(e):
-                                    logger.warning(f"⚠️ Re-price failed (Post-Only). Skipping this update.")
-                                else:
-                                    logger.error(f"Re-price error: {e}")
+                                self.bid_order_id = new_id
 
                     else:  # locked_side == "ask"
                         new_price = round(lighter_ask_new + offset_new, 1)
                         if new_price != ask_price:
-                            try:
-                                # Cancel old first
-                                if self.ask_order_id:
-                                    try:
-                                        self.o1.cancel_order(self.ask_order_id)
-                                    except: pass
-                                
+                            new_id = await self._reprice_order(
+                                "ask", self.ask_order_id, new_price, elapsed
+                            )
+                            if new_id is not None:
                                 ask_price = new_price
-                                self.ask_order_id = self.o1.place_limit_order("ask", ask_price, self.open_size, post_only=True)
-                                logger.info(f"   🔄 Re-priced remainder: ASK ${ask_price:,.1f} ({elapsed:.0f}s)")
-                            except Exception as e:
-                                if "POST_ONLY" in str(e):
-                                    logger.warning(f"⚠️ Re-price failed (Post-Only). Skipping this update.")
-                                else:
-                                    logger.error(f"Re-price error: {e}")
+                                self.ask_order_id = new_id
 
                 last_reprice_time = now
 
-            # Periodic status
-            if int(elapsed) % 30 == 0 and elapsed > 5:
-                logger.info(f"   ⏳ Waiting for fill... ({elapsed:.0f}s)")
+            # Periodic status — explicit deadline so each line fires exactly
+            # once (modulo checks re-fire every poll within the same second)
+            if now >= next_status:
+                logger.info("   ⏳ Waiting for fill... (%.0fs)", elapsed)
+                next_status += 30
 
         return False
 
+    async def _reprice_order(self, side: str, old_id: int | None, new_price: float, elapsed: float) -> int | None:
+        """
+        Move a resting order to new_price in ONE signed atomic request
+        (cancel + post-only place in the same batch), so we never sit with
+        zero orders on the book and pay a single RTT instead of two.
+        Returns the new order id, or None if the reprice was skipped.
+        """
+        try:
+            cancels = [old_id] if old_id else []
+            new_ids = await self.o1.atomic_cancel_and_place(
+                cancels,
+                [{"side": side, "price": new_price, "size": self.open_size, "post_only": True}],
+            )
+            new_id = new_ids[0] if new_ids else None
+            if new_id is not None:
+                logger.info("   🔄 Re-priced remainder: %s $%.1f (%.0fs)", side.upper(), new_price, elapsed)
+            return new_id
+        except PostOnlyError:
+            logger.warning(f"⚠️ Re-price failed (Post-Only). Skipping this update.")
+            return None
+        except Exception as e:
+            logger.error(f"Re-price error: {e}")
+            return None
+
+    async def _accumulate_remainder(
+        self, target_size: float, total_filled: float, locked_side: str
+    ) -> float:
+        """
+        Fill the rest of the target with a single long-lived resting order.
+
+        One post-only order sized to the full remainder rests on the book;
+        partial fills shrink it in place on the exchange. Each fill delta
+        is hedged on Lighter as it arrives and the order is moved via
+        atomic reprice when the market drifts — no place/poll/cancel
+        re-entry per remainder attempt, and no window with nothing resting.
+        Returns the updated total_filled.
+        """
+        self.state = self.OPENING
+        poll_s = config.POLL_INTERVAL_S
+        timeout_s = config.ORDER_TIMEOUT_S
+        reprice_s = config.CLOSE_REPRICE_S
+        spread_frac = config.SPREAD_OFFSET_BPS / 10000
+
+        remaining = round(target_size - total_filled, 5)
+        logger.info(
+            f"📋 Resting remainder: {locked_side.upper()} {remaining:.5f} BTC "
+            f"(filled {total_filled:.5f} / {target_size:.5f})"
+        )
+
+        lighter_bid, lighter_ask = await self.lighter.get_best_bid_ask()
+        if lighter_bid <= 0 or lighter_ask <= 0:
+            logger.error("Cannot fetch Lighter BBO — abandoning remainder")
+            return total_filled
+        offset = (lighter_bid + lighter_ask) / 2 * spread_frac
+        if locked_side == "bid":
+            price = round(lighter_bid - offset, 1)
+        else:
+            price = round(lighter_ask + offset, 1)
+
+        initial_pos = await self.o1.get_position()
+
+        try:
+            order_id = await self.o1.place_limit_order(
+                locked_side, price, remaining, post_only=True
+            )
+        except PostOnlyError:
+            logger.warning("⚠️ Remainder order crossed book (Post-Only). Abandoning remainder.")
+            return total_filled
+        if locked_side == "bid":
+            self.bid_order_id = order_id
+        else:
+            self.ask_order_id = order_id
+
+        self._drain_fill_events()
+        watcher = asyncio.create_task(self._watch_o1_fills(initial_pos))
+        self._hedge_failed = False
+        hedger = asyncio.create_task(self._hedger_worker())
+        mono = time.monotonic
+        start = mono()
+        last_reprice = start
+        next_status = start + 30
+
+        try:
+            while (
+                total_filled < target_size * 0.95
+                and self._running and self._enabled
+            ):
+                try:
+                    delta = await asyncio.wait_for(
+                        self._fill_events.get(), timeout=poll_s
+                    )
+                except asyncio.TimeoutError:
+                    delta = 0.0
+
+                now = mono()
+                elapsed = now - start
+
+                if self._hedge_failed:
+                    logger.error("❌ HEDGE FAILED on remainder — emergency close. PAUSING BOT.")
+                    await self._emergency_close()
+                    self._enabled = False
+                    return total_filled
+
+                if delta:
+                    fill_size = abs(delta)
+                    logger.info("🔔 Remainder fill: %.5f BTC @ ~$%.1f", fill_size, price)
+                    self.open_price = price
+                    # Hand off to the hedger worker — keep consuming fills
+                    # while the Lighter taker is in flight.
+                    self._hedge_queue.put_nowait((locked_side, fill_size))
+                    total_filled += fill_size
+                    remaining = round(target_size - total_filled, 5)
+                    continue
+
+                if elapsed > timeout_s:
+                    logger.info(
+                        f"⏰ No more fills after {timeout_s}s — "
+                        f"proceeding with {total_filled:.5f} BTC"
+                    )
+                    break
+
+                # Chase the market with the resting remainder
+                if now - last_reprice >= reprice_s:
+                    lighter_bid, lighter_ask = await self.lighter.get_best_bid_ask()
+                    if lighter_bid > 0 and lighter_ask > 0:
+                        offset = (lighter_bid + lighter_ask) / 2 * spread_frac
+                        if locked_side == "bid":
+                            new_price = round(lighter_bid - offset, 1)
+                            old_id = self.bid_order_id
+                        else:
+                            new_price = round(lighter_ask + offset, 1)
+                            old_id = self.ask_order_id
+                        if new_price != price:
+                            self.open_size = remaining
+                            new_id = await self._reprice_order(
+                                locked_side, old_id, new_price, elapsed
+                            )
+                            if new_id is not None:
+                                price = new_price
+                                if locked_side == "bid":
+                                    self.bid_order_id = new_id
+                                else:
+                                    self.ask_order_id = new_id
+                    last_reprice = now
+
+                if now >= next_status:
+                    logger.info(
+                        "   ⏳ Accumulating... %.5f / %.5f BTC (%.0fs)",
+                        total_filled, target_size, elapsed,
+                    )
+                    next_status += 30
+
+            # Let in-flight hedges finish before tearing down
+            await self._hedge_queue.join()
+            if self._hedge_failed:
+                logger.error("❌ HEDGE FAILED on remainder — emergency close. PAUSING BOT.")
+                await self._emergency_close()
+                self._enabled = False
+        finally:
+            watcher.cancel()
+            hedger.cancel()
+            await self._cancel_open_orders()
+
+        return total_filled
+
+    async def _hedger_worker(self):
+        """
+        Drain the hedge queue, issuing one Lighter taker per fill delta.
+
+        Runs concurrently with the accumulation loop so a storm of partial
+        fills is hedged at Lighter-RTT pace instead of serializing behind
+        the opening loop. Failures raise the _hedge_failed flag for the
+        producer to act on.
+        """
+        while True:
+            side, size = await self._hedge_queue.get()
+            try:
+                self.open_side = side
+                self.open_size = size
+                if not await self._phase_hedging():
+                    self._hedge_failed = True
+            except Exception as e:
+                logger.error(f"Hedger worker error: {e}")
+                self._hedge_failed = True
+            finally:
+                self._hedge_queue.task_done()
+
     # ─── Phase 2: HEDGING ────────────────────────────────────────────────────
 
     async def _phase_hedging(self) -> bool:
@@ -618,76 +937,87 @@ class CycleFarmer:
 
     # ─── Phase 3: HOLDING ────────────────────────────────────────────────────
 
-    async def _phase_holding(self):
+    async def _phase_holding(self, hold_s: float):
         """Wait for the hold duration while monitoring for liquidation risk."""
         self.state = self.HOLDING
-        
-        # Randomize hold duration
-        hold_s = random.uniform(*config.HOLD_DURATION_RANGE_S)
+
         self.hold_duration_s = hold_s
         hold_mins = hold_s / 60
         
-        self.hold_start_time = time.time()
+        self.hold_start_time = time.monotonic()
         logger.info(
             f"⏳ HOLDING for {hold_mins:.1f} minutes... "
-            f"(Monitoring liquidation risk every 15s)"
+            f"(Monitoring liquidation risk on price ticks)"
         )
-        
-        while self._running:
-            now = time.time()
-            accumulated_time = now - self.hold_start_time
-            remaining = hold_s - accumulated_time
-            
-            if remaining <= 0:
-                logger.info("⏳ Hold complete.")
-                return 
 
-            # Status update every minute
-            if int(accumulated_time) % 60 < 15 and accumulated_time > 10:
-                logger.info(
-                    f"   ⏳ Holding... {accumulated_time/60:.1f}m elapsed, "
-                    f"{remaining/60:.1f}m remaining | Side: {self.open_side} | "
-                    f"Size: {self.open_size:.5f} BTC"
-                )
+        # Precompute the trigger prices once — the per-tick liquidation
+        # check then reduces to two compares against the current mid.
+        # Threshold: -80% of margin (e.g. at 40x, that's a -2% price move)
+        # Lighter liq fee is 1% of notional, so likely triggers around -1.5% to -2% move.
+        # -0.8 ensures we get out before -1.0 (bankruptcy)
+        threshold = -0.80
+        leverage = config.LEVERAGE
+        sign_o1 = 1.0 if self.open_side == "bid" else -1.0
+        hedge_ref = self.hedge_price or self.open_price  # Fallback
+        # 01 leg breaches when mid moves through this price against the open
+        trigger_o1 = self.open_price * (1 + sign_o1 * threshold / leverage)
+        # Lighter leg holds the opposite side, so its trigger flips
+        trigger_lighter = hedge_ref * (1 - sign_o1 * threshold / leverage)
+
+        # Price ticks come from the Lighter tick stream — this loop only
+        # wakes on a new mid price (or the hold deadline), instead of
+        # fetching the BBO itself every iteration.
+        self.lighter.start_tick_stream(15.0)
+        self._hold_interrupted = False
+        next_status = self.hold_start_time + 60
+        mono = time.monotonic
+        safety_task = asyncio.create_task(self._watch_external_close())
+        try:
+            while self._running:
+                now = mono()
+                accumulated_time = now - self.hold_start_time
+                remaining = hold_s - accumulated_time
 
-            # Liquidation Check (every 15s)
-            check_interval = 15
-            sleep_time = min(remaining, check_interval)
-            
-            # Use wait_for to allow cancellation
-            try:
-                await asyncio.sleep(sleep_time)
-            except asyncio.CancelledError:
-                raise
-
-            # Get current market price (Lighter mid is a good proxy for both)
-            bid, ask = await self.lighter.get_best_bid_ask()
-            if bid > 0 and ask > 0:
-                mid_price = (bid + ask) / 2
-                
-                # Check 01 Leg (Maker)
-                o1_pnl_pct = 0.0
-                if self.open_side == "bid":  # Long
-                    o1_pnl_pct = (mid_price - self.open_price) / self.open_price * config.LEVERAGE
-                else:  # Short
-                    o1_pnl_pct = (self.open_price - mid_price) / self.open_price * config.LEVERAGE
-                
-                # Check Lighter Leg (Taker)
-                lighter_pnl_pct = 0.0
-                # Hedge side is opposite of open_side
-                if self.open_side == "bid":  # Hedge is Short
-                    limit_price = self.hedge_price or self.open_price # Fallback
-                    lighter_pnl_pct = (limit_price - mid_price) / limit_price * config.LEVERAGE
-                else:  # Hedge is Long
-                    limit_price = self.hedge_price or self.open_price
-                    lighter_pnl_pct = (mid_price - limit_price) / limit_price * config.LEVERAGE
-
-                # Threshold: -80% of margin (e.g. at 40x, that's a -2% price move)
-                # Lighter liq fee is 1% of notional, so likely triggers around -1.5% to -2% move.
-                # -0.8 ensures we get out before -1.0 (bankruptcy)
-                threshold = -0.80
-                
-                if o1_pnl_pct < threshold or lighter_pnl_pct < threshold:
+                if remaining <= 0:
+                    logger.info("⏳ Hold complete.")
+                    return
+
+                if self._hold_interrupted:
+                    logger.warning("⚠️ Position closed externally! Ending hold early.")
+                    break
+
+                # Status update every minute (single deadline, fires once)
+                if now >= next_status:
+                    next_status += 60
+                    logger.info(
+                        "   ⏳ Holding... %.1fm elapsed, %.1fm remaining | "
+                        "Side: %s | Size: %.5f BTC",
+                        accumulated_time / 60, remaining / 60,
+                        self.open_side, self.open_size,
+                    )
+
+                # Wait for the next price tick (or the hold deadline)
+                try:
+                    await asyncio.wait_for(
+                        self.lighter.tick_event.wait(), timeout=min(remaining, 15)
+                    )
+                    self.lighter.tick_event.clear()
+                except asyncio.TimeoutError:
+                    continue
+
+                # Current market price (Lighter mid is a good proxy for both)
+                mid_price = self.lighter.last_mid
+                if mid_price <= 0:
+                    continue
+
+                # Two compares against the precomputed trigger prices
+                if (
+                    sign_o1 * (mid_price - trigger_o1) < 0
+                    or sign_o1 * (mid_price - trigger_lighter) > 0
+                ):
+                    # Breached — compute the actual PnL numbers for the alert
+                    o1_pnl_pct = sign_o1 * (mid_price - self.open_price) / self.open_price * leverage
+                    lighter_pnl_pct = sign_o1 * (hedge_ref - mid_price) / hedge_ref * leverage
                     msg = (
                         f"🚨 LIQUIDATION RISK! "
                         f"01 PnL: {o1_pnl_pct*100:.1f}% | Lighter PnL: {lighter_pnl_pct*100:.1f}% "
@@ -696,12 +1026,21 @@ class CycleFarmer:
                     logger.warning(msg)
                     await self._send_alert(msg)
                     return # Exit hold loop to trigger close phase immediately
-            # Safety check: if position closed somehow externally, break early
-            if accumulated_time % 60 == 0:
-                pos = self.o1.get_position()
-                if abs(pos) < 0.00001:
-                    logger.warning("⚠️ Position closed externally! Ending hold early.")
-                    break
+        finally:
+            safety_task.cancel()
+
+    async def _watch_external_close(self):
+        """Coarse safety net: notice the 01 position vanishing mid-hold."""
+        while True:
+            await asyncio.sleep(60)
+            try:
+                pos = await self.o1.get_position()
+            except Exception:
+                continue
+            if abs(pos) < config.FLAT_THRESHOLD_BTC:
+                self._hold_interrupted = True
+                self.lighter.tick_event.set()  # wake the hold loop now
+                return
 
     # ─── Phase 4: CLOSING ────────────────────────────────────────────────────
 
@@ -712,6 +1051,7 @@ class CycleFarmer:
         Handles partial fills by incrementally unwinding Lighter.
         """
         self.state = self.CLOSING
+        self._lighter_unwound_so_far = 0.0
 
         # Determine close side (Opposite of open)
         close_side = "ask" if self.open_side == "bid" else "bid"
@@ -723,141 +1063,225 @@ class CycleFarmer:
 
         last_reprice_time = 0.0
         current_close_price = 0.0
-        
+
         # Track position to detect fills
-        initial_pos = self.o1.get_position()
-        last_checked_pos = initial_pos
-        
+        initial_pos = await self.o1.get_position()
+        remaining_size = abs(initial_pos)
+
         # If already flat?
-        if abs(initial_pos) < 0.00001:
+        if remaining_size < config.FLAT_THRESHOLD_BTC:
              logger.info("📋 CLOSING | Position already flat on 01.")
              return True
 
-        logger.info(f"📋 CLOSING | Chasing market as MAKER ({close_side.upper()})...")
+        logger.info("📋 CLOSING | Chasing market as MAKER (%s)...", close_side.upper())
+
+        # Snapshot hot-loop config once (same rationale as _await_open_fill)
+        poll_s = config.POLL_INTERVAL_S
+        reprice_s = config.CLOSE_REPRICE_S
+        buffer = config.CLOSE_BUFFER_USD
+        slippage_bps = config.HEDGE_SLIPPAGE_BPS
+        flat = config.FLAT_THRESHOLD_BTC
+        hysteresis = config.REPRICE_HYSTERESIS_USD
 
         if config.DRY_RUN:
             lighter_bid, lighter_ask = await self.lighter.get_best_bid_ask()
             close_price = lighter_bid if close_side == "ask" else lighter_ask
-            logger.info(f"[DRY RUN] Simulating close fill @ ${close_price:,.1f}")
+            logger.info("[DRY RUN] Simulating close fill @ $%.1f", close_price)
             return True
 
-        start_time = time.time()
+        mono = time.monotonic
+        start_time = mono()
 
-        while self._running:
-            now = time.time()
-            elapsed = now - start_time
-            
-            # Check current position (source of truth)
-            current_pos = self.o1.get_position()
-            remaining_size = abs(current_pos)
-            
-            # Check for partial fills (Position reduced)
-            # Use abs() because position can be negative (Short on 01)
-            # Delta is how much size we closed since last check
-            delta = abs(last_checked_pos) - remaining_size
-            
-            # Update tracker
-            last_checked_pos = current_pos
+        # Fills arrive as events from the watcher task — the loop wakes on
+        # a fill (or the poll timeout for reprice checks) instead of doing
+        # its own position read every iteration.
+        self._drain_fill_events()
+        watcher = asyncio.create_task(self._watch_o1_fills(initial_pos))
 
-            if delta > 0.00001:
-                logger.info(f"🔔 Partial Close Fill detected: {delta:.5f} BTC. Unwinding Lighter immediately...")
-                
-                # Unwind the filled amount on Lighter immediately
-                # "Fire and forget" approach within the loop to keep closng 01
-                # _phase_unwinding will catch any cleanup later
+        try:
+            while self._running:
                 try:
-                    await self.lighter.place_taker_order(
-                        side=lighter_unwind_side,
-                        size=delta,
-                        slippage_bps=config.HEDGE_SLIPPAGE_BPS
+                    delta_evt = await asyncio.wait_for(
+                        self._fill_events.get(), timeout=poll_s
                     )
-                except Exception as e:
-                    logger.error(f"Failed to unwind partial fill on Lighter: {e}")
-            
-            # If flat, we are done
-            if remaining_size < 0.00001:
-                logger.info("✅ 01 Position closed successfully (Flat).")
-                # Cancel close order if exists
-                if self.close_order_id:
-                     try:
-                         self.o1.cancel_order(self.close_order_id)
-                     except: pass
-                     self.close_order_id = None
-                return True
+                except asyncio.TimeoutError:
+                    delta_evt = 0.0
+
+                now = mono()
+                elapsed = now - start_time
+
+                if delta_evt:
+                    # Only deltas in the close direction count as progress:
+                    # an "ask" close unwinds a long, so the position must
+                    # shrink (delta < 0); mirrored for shorts.
+                    toward_flat = (
+                        delta_evt < 0 if close_side == "ask" else delta_evt > 0
+                    )
+                    delta = abs(delta_evt)
+
+                    if not toward_flat:
+                        # Adverse move (external/manual fill) — the position
+                        # grew, so there is MORE to close. Re-size toward the
+                        # true position; hedging it as progress would stack
+                        # exposure on the wrong side.
+                        remaining_size = round(remaining_size + delta, 5)
+                        logger.warning(
+                            "⚠️ Adverse position change: %.5f BTC away from flat. "
+                            "Close size now %.5f — not unwinding.",
+                            delta, remaining_size,
+                        )
+                        # Force an immediate cancel/replace so the resting
+                        # close order picks up the new size.
+                        last_reprice_time = 0.0
+                        current_close_price = 0.0
+                    else:
+                        # Position moved toward flat — unwind the filled amount
+                        remaining_size = round(max(remaining_size - delta, 0.0), 5)
+                        logger.info("🔔 Partial Close Fill detected: %.5f BTC. Unwinding Lighter immediately...", delta)
+
+                        # Unwind the filled amount on Lighter immediately.
+                        # Truly fire-and-forget: the hedge RTT overlaps the close
+                        # chase instead of stalling it. _phase_unwinding gathers
+                        # these tasks before its flatness check.
+                        task = asyncio.create_task(self.lighter.place_taker_order(
+                            side=lighter_unwind_side,
+                            size=delta,
+                            slippage_bps=slippage_bps,
+                        ))
+                        self._pending_unwinds.add(task)
+                        task.add_done_callback(self._pending_unwinds.discard)
+                        task.add_done_callback(self._log_unwind_err)
+                        task.add_done_callback(
+                            lambda t, s=delta: self._record_unwound(t, s)
+                        )
 
-            # Re-price the close order periodically
-            if now - last_reprice_time >= config.CLOSE_REPRICE_S:
-                # Get fresh 01 BBO
-                o1_bbo = self.o1.get_best_bid_ask()
-                o1_bid, o1_ask = o1_bbo[0], o1_bbo[1]
-                if o1_bid <= 0 or o1_ask <= 0:
-                    logger.warning("Cannot fetch 01 BBO — will retry...")
-                    await asyncio.sleep(config.POLL_INTERVAL_S)
-                    continue
+                # If flat, we are done
+                if remaining_size < flat:
+                    logger.info("✅ 01 Position closed successfully (Flat).")
+                    # Cancel close order if exists
+                    if self.close_order_id:
+                         try:
+                             await self.o1.cancel_order(self.close_order_id)
+                         except: pass
+                         self.close_order_id = None
+                    return True
 
-                # Place close order "further away" (Maker)
-                buffer = config.CLOSE_BUFFER_USD
-                
-                if close_side == "ask":
-                    new_price = round(o1_ask + buffer, 1)
-                else:
-                    new_price = round(o1_bid - buffer, 1)
+                # Re-price the close order periodically
+                if now - last_reprice_time >= reprice_s:
+                    # Get fresh 01 BBO
+                    o1_bbo = await self.o1.get_best_bid_ask()
+                    o1_bid, o1_ask = o1_bbo[0], o1_bbo[1]
+                    if o1_bid <= 0 or o1_ask <= 0:
+                        logger.warning("Cannot fetch 01 BBO — will retry...")
+                        continue
 
-                # Only update if price changed
-                if new_price != current_close_price:
-                    logger.info(
-                        f"   📋 Re-pricing close: {close_side.upper()} "
-                        f"@ ${new_price:,.1f} (01 BBO: ${o1_bid:,.1f}/${o1_ask:,.1f}) "
-                        f"[{elapsed:.0f}s elapsed] (Size: {remaining_size:.5f})"
-                    )
-                    current_close_price = new_price
+                    # Place close order "further away" (Maker)
+                    if close_side == "ask":
+                        new_price = round(o1_ask + buffer, 1)
+                    else:
+                        new_price = round(o1_bid - buffer, 1)
 
-                    # Cancel old close order
-                    if self.close_order_id:
+                    # Hysteresis band: BBO jitter smaller than the band is
+                    # tick noise — don't pay a cancel/replace for it.
+                    if abs(new_price - current_close_price) < hysteresis:
+                        last_reprice_time = now
+                        continue
+
+                    # Only update if price changed
+                    if new_price != current_close_price:
+                        logger.info(
+                            "   📋 Re-pricing close: %s @ $%.1f (01 BBO: $%.1f/$%.1f) "
+                            "[%.0fs elapsed] (Size: %.5f)",
+                            close_side.upper(), new_price, o1_bid, o1_ask,
+                            elapsed, remaining_size,
+                        )
+
+                        # Cancel + replace in ONE signed atomic request —
+                        # half the round-trips, and the book is never
+                        # un-quoted between cancel and place.
+                        cancels = [self.close_order_id] if self.close_order_id else []
                         try:
-                            self.o1.cancel_order(self.close_order_id)
-                        except Exception: pass
-                    
-                    # Place new for REMAINING size
-                    self.close_order_id = self.o1.place_limit_order(
-                        close_side, current_close_price, remaining_size, post_only=True
-                    )
-                
-                last_reprice_time = now
+                            new_ids = await self.o1.atomic_cancel_and_place(
+                                cancels,
+                                [{"side": close_side, "price": new_price,
+                                  "size": remaining_size, "post_only": True}],
+                            )
+                            self.close_order_id = new_ids[0] if new_ids else None
+                            current_close_price = new_price
+                        except PostOnlyError:
+                            # Old order (if any) keeps resting — retry next tick
+                            logger.warning("⚠️ Close re-price rejected (Post-Only). Keeping old order.")
+
+                    last_reprice_time = now
+        finally:
+            watcher.cancel()
 
-            await asyncio.sleep(config.POLL_INTERVAL_S)
-        
         return False
 
+    @staticmethod
+    def _log_unwind_err(task: asyncio.Task):
+        """Done-callback for fire-and-forget unwind tasks — surface failures."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.error(f"Partial-fill unwind on Lighter failed: {exc}")
+
+    def _record_unwound(self, task: asyncio.Task, size: float):
+        """Done-callback: tally successfully hedged size for the skip check."""
+        if task.cancelled() or task.exception():
+            return
+        response, _ = task.result()
+        if response:
+            self._lighter_unwound_so_far += size
+
     # ─── Phase 5: UNWINDING ──────────────────────────────────────────────────
 
     async def _phase_unwinding(self):
         """Close the Lighter hedge via taker market order."""
         self.state = self.UNWINDING
-        
-        # IMPORTANT: Partial close fills may have ALREADY unwound Lighter.
-        # The Lighter API can be slow to reflect recent trades.
-        # Wait a few seconds to let the API catch up before checking.
-        logger.info("⏳ Waiting 5s for Lighter API to settle before unwind check...")
-        await asyncio.sleep(5)
-        
-        # Get EXACT position on Lighter to unwind (handles any rounding diffs)
-        lighter_pos = await self.lighter.get_position()
-        
-        # Double-check: wait a bit more and re-read to confirm it's not stale
-        if abs(lighter_pos) > 0.000005:
-            await asyncio.sleep(3)
-            lighter_pos_2 = await self.lighter.get_position()
-            
-            # If the two reads differ significantly, the API is still updating.
-            # Use the SMALLER value (more recent) to avoid over-trading.
-            if abs(lighter_pos_2) < abs(lighter_pos):
-                logger.info(f"📉 Position updated during wait: {lighter_pos:.5f} → {lighter_pos_2:.5f}")
-                lighter_pos = lighter_pos_2
-        
+
+        # Reconcile any fire-and-forget partial unwinds still in flight
+        # before reading the position — otherwise we'd double-hedge them.
+        if self._pending_unwinds:
+            await asyncio.gather(*self._pending_unwinds, return_exceptions=True)
+
+        # Fast path: if the partial-fill hedges already covered the whole
+        # position, one confirming read replaces the settle sleeps below —
+        # served straight from the client cache when it's still fresh.
+        expected_remaining = self.open_size - self._lighter_unwound_so_far
+        if expected_remaining < config.DUST_THRESHOLD_BTC:
+            lighter_pos = await self.lighter.get_position()
+            if abs(lighter_pos) < config.DUST_THRESHOLD_BTC:
+                logger.info("✅ Partial-fill hedges already flattened Lighter. Skipping unwind.")
+                return
+            logger.warning(
+                "Expected Lighter flat (unwound %.5f of %.5f) but position is %.5f — re-checking.",
+                self._lighter_unwound_so_far, self.open_size, lighter_pos,
+            )
+
+        # IMPORTANT: Partial close fills may have ALREADY unwound Lighter and
+        # the API can lag recent trades. Instead of fixed settle sleeps, poll
+        # until two consecutive reads agree (or we're flat) — the API usually
+        # catches up in well under the old 5s+3s worst case.
+        lighter_pos = await self.lighter.get_position(force=True)
+        prev_pos = None
+        settle_deadline = time.monotonic() + 8
+        while (
+            abs(lighter_pos) > config.DUST_THRESHOLD_BTC
+            and lighter_pos != prev_pos
+            and time.monotonic() < settle_deadline
+        ):
+            prev_pos = lighter_pos
+            await asyncio.sleep(1)
+            lighter_pos = await self.lighter.get_position(force=True)
+            # Shrinking reads mean trades are still landing — keep the most
+            # recent (smaller) value to avoid over-trading.
+            if abs(lighter_pos) < abs(prev_pos):
+                logger.info("📉 Position updated during wait: %.5f → %.5f", prev_pos, lighter_pos)
+
         # If flat or tiny dust, nothing to do
-        # Threshold lowered to 0.000005 (500 sats) to catch ~$0.35 scraps
-        if abs(lighter_pos) < 0.000005: 
+        if abs(lighter_pos) < config.DUST_THRESHOLD_BTC:
             logger.info("✅ Lighter position already flat/dust. Skipping unwind.")
             return
 
@@ -871,7 +1295,7 @@ class CycleFarmer:
         # Use timestamp to ensure uniqueness across bot restarts (prevents DUPLICATE error)
         unwind_id = int(time.time() * 1000)
         
-        logger.info(f"🔓 UNWINDING | {unwind_side.upper()} {unwind_size:.5f} BTC on Lighter (ID: {unwind_id})")
+        logger.info("🔓 UNWINDING | %s %.5f BTC on Lighter (ID: %d)", unwind_side.upper(), unwind_size, unwind_id)
 
         response, _ = await self.lighter.place_taker_order(
             side=unwind_side,
@@ -884,29 +1308,32 @@ class CycleFarmer:
             logger.info("✅ Unwind order sent. Verifying (polling)...")
             
             # Poll for update (max 20s) to avoid race condition/stale data
-            start_poll = time.time()
+            start_poll = time.monotonic()
             final_pos = lighter_pos # assume unchanged initially
-            
-            while time.time() - start_poll < 20:
+            dust = config.DUST_THRESHOLD_BTC
+            flipped = False
+
+            while time.monotonic() - start_poll < 20:
                 await asyncio.sleep(2)
-                final_pos = await self.lighter.get_position()
-                
+                final_pos = await self.lighter.get_position(force=True)
+
                 # If flat, we are good!
-                if abs(final_pos) < 0.000005:
+                if abs(final_pos) < dust:
                     logger.info("✅ Verification successful! Lighter is flat.")
                     break
-                
+
                 # CRITICAL: If position FLIPPED sign (e.g. Short -> Long), we definitely over-traded or someone else traded.
                 # Stop immediately to prevent further damage.
-                if (lighter_pos > 0 and final_pos < -0.000005) or (lighter_pos < 0 and final_pos > 0.000005):
-                    logger.warning(f"🚨 Position FLIPPED sign during unwind! ({lighter_pos} -> {final_pos}). Stopping verify.")
+                flipped = _flipped(lighter_pos, final_pos, dust)
+                if flipped:
+                    logger.warning("🚨 Position FLIPPED sign during unwind! (%s -> %s). Stopping verify.", lighter_pos, final_pos)
                     break
 
-            if abs(final_pos) > 0.000005:
+            if abs(final_pos) > dust:
                 # Still not flat after 20s?
-                
-                # Double check if we flipped sign before retrying
-                if (lighter_pos > 0 and final_pos < -0.000005) or (lighter_pos < 0 and final_pos > 0.000005):
+
+                # Reuse the in-loop flip verdict before retrying
+                if flipped:
                      msg = f"⚠️ Unwind resulted in OPPOSITE position ({final_pos} BTC). Do not retry."
                      logger.error(msg)
                      await self._send_alert(msg)
@@ -927,8 +1354,8 @@ class CycleFarmer:
                     await asyncio.sleep(5) 
                     
                     # Check one last time
-                    final_pos_2 = await self.lighter.get_position()
-                    if abs(final_pos_2) > 0.000005:
+                    final_pos_2 = await self.lighter.get_position(force=True)
+                    if abs(final_pos_2) > config.DUST_THRESHOLD_BTC:
                          crit = f"🚨 CRITICAL: Lighter unwind blocked! Stuck with {final_pos_2} BTC."
                          logger.error(crit)
                          await self._send_alert(crit)
@@ -940,11 +1367,9 @@ class CycleFarmer:
 
         # Log cycle summary
         logger.info(
-            f"\n{'─' * 40}\n"
-            f"  Cycle {self.cycle_count} Complete\n"
-            f"  Opened: {self.open_side} {self.open_size:.5f} BTC @ ${self.open_price:,.1f}\n"
-            f"  Volume generated: ${self.open_size * self.open_price * 2:,.2f}\n"
-            f"{'─' * 40}"
+            _CYCLE_SUMMARY_TMPL,
+            self.cycle_count, self.open_side, self.open_size,
+            self.open_price, self.open_size * self.open_price * 2,
         )
         
         self.last_cycle_stats = {
@@ -965,50 +1390,81 @@ class CycleFarmer:
 
     # ─── Phase 6: COOLDOWN ───────────────────────────────────────────────────
 
-    async def _phase_cooldown(self):
-        """Wait randomly between cycles."""
+    async def _phase_cooldown(self, cooldown_mins: float):
+        """Wait between cycles (duration drawn in the cycle plan)."""
         self.state = self.COOLDOWN
-        
-        # Randomize cooldown duration
-        cd_min, cd_max = config.COOLDOWN_MINUTES_RANGE
-        cooldown_mins = random.uniform(cd_min, cd_max)
+
         self.cooldown_duration_s = cooldown_mins * 60
-        self.cooldown_start_time = time.time()
-        
-        logger.info(f"💤 Cooling down for {cooldown_mins:.1f} minutes...")
+        self.cooldown_start_time = time.monotonic()
+
+        logger.info("💤 Cooling down for %.1f minutes...", cooldown_mins)
 
-        elapsed = 0
-        while elapsed < self.cooldown_duration_s and self._running:
-            await asyncio.sleep(min(10, self.cooldown_duration_s - elapsed))
-            elapsed = time.time() - self.cooldown_start_time
+        # One long sleep instead of 10s wakeups — the stop event breaks it
+        # immediately on shutdown.
+        try:
+            await asyncio.wait_for(
+                self._stop_event.wait(), timeout=self.cooldown_duration_s
+            )
+        except asyncio.TimeoutError:
+            pass
 
         self.state = self.IDLE
 
     # ─── Helpers ─────────────────────────────────────────────────────────────
 
-    def _cancel_open_orders(self):
-        """Cancel any active opening orders with retries."""
-        for oid in [self.bid_order_id, self.ask_order_id]:
-            if oid is not None:
-                success = False
-                for attempt in range(3):
-                    try:
-                        self.o1.cancel_order(oid)
+    def _draw_uniform(self, key: str, value_range: tuple) -> float:
+        """
+        Pop a value from a pre-generated uniform draw buffer.
+
+        Draws are generated in batches of 512 (amortizes the per-draw RNG
+        cost when replaying many cycles in DRY_RUN). The buffer is tied to
+        the range it was drawn from, so a runtime /set change to the range
+        invalidates it immediately.
+        """
+        cached = self._rand_bufs.get(key)
+        if cached is None or cached[0] != value_range or not cached[1]:
+            lo, hi = value_range
+            buf = deque(self._rng.uniform(lo, hi) for _ in range(512))
+            self._rand_bufs[key] = (value_range, buf)
+            cached = self._rand_bufs[key]
+        return cached[1].popleft()
+
+    async def _cancel_open_orders(self, extra_ids: list[int] | None = None):
+        """Cancel any active opening orders — one batched request, with retries."""
+        ids = [
+            oid for oid in
+            [self.bid_order_id, self.ask_order_id, *(extra_ids or [])]
+            if oid is not None
+        ]
+        if ids:
+            # One signed atomic request covers all outstanding orders; fall
+            # back to per-order cancels only if the batch itself errors.
+            try:
+                await self.o1.cancel_orders(ids)
+                ids = []
+            except Exception as e:
+                logger.warning("⚠️ Batch cancel failed (%s) — retrying per order...", e)
+
+        for oid in ids:
+            success = False
+            for attempt in range(3):
+                try:
+                    await self.o1.cancel_order(oid)
+                    success = True
+                    break  # Cancel succeeded
+                except Exception as e:
+                    err_str = str(e)
+                    if "ORDER_NOT_FOUND" in err_str or "FILLED" in err_str.upper():
+                        logger.debug("Cancel skipped (already filled/missing): %s", oid)
                         success = True
-                        break  # Cancel succeeded
-                    except Exception as e:
-                        err_str = str(e)
-                        if "ORDER_NOT_FOUND" in err_str or "FILLED" in err_str.upper():
-                            logger.debug(f"Cancel skipped (already filled/missing): {oid}")
-                            success = True
-                            break
-                        
-                        logger.warning(f"⚠️ Cancel failed for {oid} (attempt {attempt+1}/3): {e}")
-                        time.sleep(0.5)  # Blocking sleep is okay here for emergency cancel safety
-                
-                if not success:
-                    logger.error(f"🚨 FAILED TO CANCEL ORDER {oid} AFTER 3 ATTEMPTS! Possible orphan.")
-                    
+                        break
+
+                    logger.warning("⚠️ Cancel failed for %s (attempt %d/3): %s", oid, attempt + 1, e)
+                    await asyncio.sleep(0.5)
+
+            if not success:
+                logger.error("🚨 FAILED TO CANCEL ORDER %s AFTER 3 ATTEMPTS! Possible orphan.", oid)
+
         self.bid_order_id = None
         self.ask_order_id = None
 
@@ -1018,28 +1474,34 @@ class CycleFarmer:
 
         try:
             # Cancel any open orders on 01
-            self._cancel_open_orders()
+            await self._cancel_open_orders()
             if self.close_order_id:
                 try:
-                    self.o1.cancel_order(self.close_order_id)
+                    await self.o1.cancel_order(self.close_order_id)
                 except Exception:
                     pass
                 self.close_order_id = None
 
+            # Both positions and the 01 BBO are independent reads — fetch
+            # them concurrently so the emergency path pays one RTT, not three
+            pos, o1_bbo, lighter_pos = await asyncio.gather(
+                self.o1.get_position(),
+                self.o1.get_best_bid_ask(force=True),
+                self.lighter.get_position(),
+            )
+
             # Check 01 position and close if needed
-            pos = self.o1.get_position()
-            if abs(pos) > 0.00001:
+            if abs(pos) > config.FLAT_THRESHOLD_BTC:
                 close_side = "ask" if pos > 0 else "bid"
                 # Price at BBO (not 1% through) — we want to close but not hemorrhage
-                o1_bbo = self.o1.get_best_bid_ask()
                 o1_bid, o1_ask = o1_bbo[0], o1_bbo[1]
                 if o1_bid > 0 and o1_ask > 0:
                     if close_side == "ask":
                         price = round(o1_bid, 1)  # Sell at bid (will likely taker but at fair price)
                     else:
                         price = round(o1_ask, 1)  # Buy at ask
-                    self.o1.place_limit_order(close_side, price, abs(pos))  # No post_only — emergency
-                    logger.warning(f"Emergency 01 close: {close_side} {abs(pos):.5f} @ ${price:,.1f}")
+                    await self.o1.place_limit_order(close_side, price, abs(pos))  # No post_only — emergency
+                    logger.warning("Emergency 01 close: %s %.5f @ $%.1f", close_side, abs(pos), price)
                 else:
                     logger.error("Cannot fetch 01 BBO for emergency close — MANUAL INTERVENTION NEEDED")
                     await self._send_alert(
@@ -1048,15 +1510,14 @@ class CycleFarmer:
                     )
 
             # Check Lighter position and close if needed
-            lighter_pos = await self.lighter.get_position()
-            if abs(lighter_pos) > 0.00001:
+            if abs(lighter_pos) > config.FLAT_THRESHOLD_BTC:
                 unwind_side = "sell" if lighter_pos > 0 else "buy"
                 await self.lighter.place_taker_order(
                     side=unwind_side,
                     size=abs(lighter_pos),
                     slippage_bps=50,  # Wide slippage for emergency
                 )
-                logger.warning(f"Emergency Lighter close: {unwind_side} {abs(lighter_pos):.5f}")
+                logger.warning("Emergency Lighter close: %s %.5f", unwind_side, abs(lighter_pos))
 
         except Exception as e:
             logger.error(f"Emergency close error: {e}", exc_info=True)
@@ -1066,19 +1527,17 @@ class CycleFarmer:
         """Graceful shutdown."""
         logger.info("─── Shutting down ───")
         self._running = False
+        self._stop_event.set()
 
-        # Cancel all orders
-        self._cancel_open_orders()
-        if self.close_order_id:
-            try:
-                self.o1.cancel_order(self.close_order_id)
-            except Exception:
-                pass
+        # Cancel all orders — open and close sides ride one batch request
+        extra = [self.close_order_id] if self.close_order_id else []
+        await self._cancel_open_orders(extra_ids=extra)
+        self.close_order_id = None
 
         # Warn about any open positions
         try:
-            pos_01 = self.o1.get_position()
-            if abs(pos_01) > 0.00001:
+            pos_01 = await self.o1.get_position()
+            if abs(pos_01) > config.FLAT_THRESHOLD_BTC:
                 msg = (
                     f"⚠️ SHUTDOWN WARNING: Open 01 position: {pos_01:.5f} BTC. "
                     f"Close manually or run emergency_hedge.py!"
@@ -1088,14 +1547,18 @@ class CycleFarmer:
         except Exception:
             pass
 
-        # Close Lighter connection
+        # Close connections
         try:
             if hasattr(self, 'lighter'):
                  await self.lighter.close()
         except Exception:
             pass
+        try:
+            await self.o1.close()
+        except Exception:
+            pass
         
         # Suppress final SSL errors on exit
         await asyncio.sleep(0.1)
 
-        logger.info(f"─── Shutdown complete ({self.cycle_count} cycles run) ───")
+        logger.info("─── Shutdown complete (%d cycles run) ───", self.cycle_count)
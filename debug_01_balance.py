@@ -1,18 +1,41 @@
 import config
 import requests
+import socket
+from requests.adapters import HTTPAdapter
 import json
+from functools import lru_cache
 from base58 import b58decode, b58encode
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+
+class _NoDelayAdapter(HTTPAdapter):
+    """HTTPAdapter with Nagle disabled for small request/response pairs."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        super().init_poolmanager(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _get_signer() -> tuple[Ed25519PrivateKey, str]:
+    """Derive (private_key, pubkey_b58) once per process."""
+    key_bytes = b58decode(config.O1_PRIVATE_KEY)
+    private_key = Ed25519PrivateKey.from_private_bytes(key_bytes[:32])
+    pubkey_str = b58encode(private_key.public_key().public_bytes_raw()).decode()
+    return private_key, pubkey_str
+
+
 def main():
     print(f"Checking balance against: {config.O1_API_URL}")
-    
-    # 1. Derive Pubkey
+
+    # One keep-alive session for both calls — the second request reuses
+    # the TCP+TLS connection instead of paying a fresh handshake.
+    session = requests.Session()
+    session.mount(config.O1_API_URL, _NoDelayAdapter(pool_connections=4, pool_maxsize=8))
+
+    # 1. Derive Pubkey (cached — repeat calls reuse the parsed key)
     try:
-        key_bytes = b58decode(config.O1_PRIVATE_KEY)
-        private_key = Ed25519PrivateKey.from_private_bytes(key_bytes[:32])
-        pubkey_bytes = private_key.public_key().public_bytes_raw()
-        pubkey_str = b58encode(pubkey_bytes).decode()
+        _, pubkey_str = _get_signer()
         print(f"User Pubkey: {pubkey_str}")
     except Exception as e:
         print(f"Error deriving key: {e}")
@@ -20,7 +43,7 @@ def main():
 
     # 2. Get Account ID
     try:
-        user_resp = requests.get(f"{config.O1_API_URL}/user/{pubkey_str}")
+        user_resp = session.get(f"{config.O1_API_URL}/user/{pubkey_str}")
         user_resp.raise_for_status()
         user_data = user_resp.json()
         print(f"User Data: {json.dumps(user_data, indent=2)}")
@@ -39,7 +62,7 @@ def main():
 
     # 3. Get Account Balance
     try:
-        account_resp = requests.get(f"{config.O1_API_URL}/account/{account_id}")
+        account_resp = session.get(f"{config.O1_API_URL}/account/{account_id}")
         account_resp.raise_for_status()
         account_data = account_resp.json()
         print(f"Account Data (Raw): {json.dumps(account_data, indent=2)}")
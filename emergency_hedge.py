@@ -33,12 +33,13 @@ async def main():
 
     try:
         logger.info("Connecting to exchanges...")
-        o1.initialize()
+        await o1.initialize()
         await lighter.initialize()
 
-        # Get positions
-        pos_01 = o1.get_position()
-        pos_lighter = await lighter.get_position()
+        # Get positions (independent reads — overlap them)
+        pos_01, pos_lighter = await asyncio.gather(
+            o1.get_position(), lighter.get_position()
+        )
 
         net_pos = pos_01 + pos_lighter
         logger.info(f"\n📊 STATUS")
@@ -81,6 +82,7 @@ async def main():
         logger.error(f"Error: {e}", exc_info=True)
     finally:
         await lighter.close()
+        await o1.close()
         logger.info("\nDone.")
 
 
@@ -4,12 +4,26 @@ Session management, order placement, and market data via protobuf + HTTP.
 Based on: https://docs.01.xyz/examples/python
 """
 
+import asyncio
 import json
+import os
+import socket
 import time
 import logging
 import binascii
-import requests
-from google.protobuf.internal import encoder, decoder
+
+# Force the C-backed upb protobuf runtime — the pure-Python fallback is an
+# order of magnitude slower at the SerializeToString/ParseFromString pair
+# every order action pays. Must be set before any google.protobuf import.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import httpx
+
+try:
+    import orjson  # Rust JSON — decodes straight from response bytes
+except ImportError:
+    orjson = None
+
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from base58 import b58decode, b58encode
 
@@ -18,11 +32,63 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Enum values resolved once — each access otherwise walks the protobuf
+# EnumTypeWrapper descriptor chain, which the atomic loop pays per order.
+_SIDE_MAP = {"bid": schema_pb2.Side.BID, "ask": schema_pb2.Side.ASK}
+_FM_POST_ONLY = schema_pb2.FillMode.POST_ONLY
+_FM_LIMIT = schema_pb2.FillMode.LIMIT
+
+# Cached session state, reused across restarts so a dev crash-loop doesn't
+# re-pay the CreateSession round-trip every time.
+_SESSION_FILE = os.path.expanduser("~/.cycle_farmer/session.json")
+
+
+def _loads(raw: bytes):
+    """Decode a JSON response body (orjson when available, else stdlib)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# ─── Errors ──────────────────────────────────────────────────────────────────────
+
+class Exchange01Error(Exception):
+    """An action was rejected by 01 Exchange."""
+
+
+class PostOnlyError(Exchange01Error):
+    """A post-only order would have crossed the book."""
+
+
+class MarginError(Exchange01Error):
+    """Insufficient margin/collateral for the action."""
+
+
+class RiskError(Exchange01Error):
+    """The account failed the exchange's risk/health checks."""
+
+
+def _error_type(error_name: str) -> type[Exchange01Error]:
+    """Map a protobuf Error name to a typed exception (raise-time only)."""
+    if "POST_ONLY" in error_name:
+        return PostOnlyError
+    if "MARGIN" in error_name:
+        return MarginError
+    if "RISK" in error_name or "UNHEALTHY" in error_name:
+        return RiskError
+    return Exchange01Error
+
 
 # ─── Signing ─────────────────────────────────────────────────────────────────────
 
 def user_sign(key: Ed25519PrivateKey, msg: bytes) -> bytes:
-    """Sign hex-encoded message. Used for CreateSession."""
+    """Sign hex-encoded message. Used for CreateSession.
+
+    The hex round-trip doubles the SHA-512 input, but it's mandated by the
+    protocol (schema.proto: user_sign(x) => ed25519_sign(hex(x)), matching
+    Solana wallets' signMessage) — raw-bytes signing is session_sign only.
+    hexlify is the cheapest encoder for this (single C call, one alloc).
+    """
     return key.sign(binascii.hexlify(msg))
 
 
@@ -32,13 +98,37 @@ def session_sign(key: Ed25519PrivateKey, msg: bytes) -> bytes:
 
 
 # ─── Protobuf Helpers ────────────────────────────────────────────────────────────
+# Specialized, allocation-free varints for the length prefix — payloads are
+# a few hundred bytes, so the unrolled 1-3 byte cases cover everything we
+# send without going through protobuf's internal per-call helpers.
 
 def get_varint_bytes(value: int) -> bytes:
-    return encoder._VarintBytes(value)
-
-
-def read_varint(buffer: bytes, offset: int = 0):
-    return decoder._DecodeVarint32(buffer, offset)
+    if value < 0x80:
+        return bytes((value,))
+    if value < 0x4000:
+        return bytes((value & 0x7F | 0x80, value >> 7))
+    if value < 0x200000:
+        return bytes((value & 0x7F | 0x80, (value >> 7) & 0x7F | 0x80, value >> 14))
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def read_varint(buffer: bytes, offset: int = 0) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        b = buffer[offset]
+        offset += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, offset
+        shift += 7
+        if shift >= 35:
+            raise ValueError("varint too long for a 32-bit length prefix")
 
 
 # ─── Client ──────────────────────────────────────────────────────────────────────
@@ -46,17 +136,66 @@ def read_varint(buffer: bytes, offset: int = 0):
 class Exchange01Client:
     """Client for 01 Exchange using official protobuf API."""
 
+    # How long a cached BBO stays servable. Short enough that reprice math
+    # never acts on a stale book; long enough to dedupe bursts of reads
+    # from concurrent phases. Pass force=True for a guaranteed-fresh quote.
+    BBO_MAX_AGE_S = 0.1
+
     def __init__(self):
         self.api_url = config.O1_API_URL
         self.user_signkey: Ed25519PrivateKey | None = None
+        self._user_pubkey_bytes: bytes | None = None  # derived in initialize()
+        self._user_pubkey_b58: str | None = None
         self.session_signkey: Ed25519PrivateKey | None = None
         self.session_id: int | None = None
         self.session_expiry: int = 0
         self.market_info: dict | None = None
         self._nonce = 0
         self.account_id: int | None = None
+        self._price_scale: int = 1   # set from market info in initialize()
+        self._size_scale: int = 1
+
+        # Prebuilt Action templates with the per-session constants
+        # (session_id, market_id) already set — the hot order paths CopyFrom
+        # these and only touch the fields that actually vary per call.
+        self._order_tmpl: "schema_pb2.Action | None" = None
+        self._atomic_tmpl: "schema_pb2.Action | None" = None
+
+        # One keep-alive HTTP session for all calls — created lazily so the
+        # client is constructed outside the event loop without issue.
+        self._session: httpx.AsyncClient | None = None
+
+        # Last observed BBO, served within BBO_MAX_AGE_S (see class attr).
+        self._bid: float = 0.0
+        self._ask: float = 0.0
+        self._bbo_ts: float = 0.0
+
+        # Server-clock offset, extrapolated locally between periodic
+        # re-syncs so the hot order path skips the /timestamp round-trip.
+        self._clock_offset: float | None = None
+        self._clock_synced_at: float = 0.0
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._session is None:
+            # Cancel/replace POSTs are tiny — disable Nagle so they go out
+            # immediately instead of waiting up to 40ms for coalescing, and
+            # widen the socket buffers for orderbook responses.
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+                socket_options=[
+                    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                    (socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20),
+                    (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+                ],
+            )
+            self._session = httpx.AsyncClient(
+                base_url=self.api_url,
+                timeout=10.0,
+                transport=transport,
+            )
+        return self._session
 
-    def initialize(self):
+    async def initialize(self):
         """Load private key and create session."""
         logger.info("Initializing 01 Exchange client...")
 
@@ -64,12 +203,17 @@ class Exchange01Client:
         key_bytes = b58decode(config.O1_PRIVATE_KEY)
         # Phantom exports 64 bytes (private + public). Ed25519 needs first 32.
         self.user_signkey = Ed25519PrivateKey.from_private_bytes(key_bytes[:32])
-        user_pubkey = self.user_signkey.public_key().public_bytes_raw()
-        logger.info(f"User pubkey: {b58encode(user_pubkey).decode()}")
+        # Derive the public key once — session refreshes reuse these
+        self._user_pubkey_bytes = self.user_signkey.public_key().public_bytes_raw()
+        self._user_pubkey_b58 = b58encode(self._user_pubkey_bytes).decode()
+        logger.info(f"User pubkey: {self._user_pubkey_b58}")
 
         # Fetch market info
-        self.market_info = self._fetch_market_info()
+        self.market_info = await self._fetch_market_info()
         market = self.market_info[config.O1_MARKET_ID]
+        # Hoist the raw-unit multipliers out of the per-order path
+        self._price_scale = 10 ** market["price_decimals"]
+        self._size_scale = 10 ** market["size_decimals"]
         logger.info(
             f"Market {market['symbol']}: "
             f"price_dec={market['price_decimals']}, "
@@ -77,34 +221,66 @@ class Exchange01Client:
         )
 
         # Look up account ID
-        user_pubkey_str = b58encode(user_pubkey).decode()
-        resp = requests.get(f"{self.api_url}/user/{user_pubkey_str}")
+        resp = await self._http().get(f"/user/{self._user_pubkey_b58}")
         resp.raise_for_status()
-        account_ids = resp.json().get("accountIds", [])
+        account_ids = _loads(resp.content).get("accountIds", [])
         if account_ids:
             self.account_id = account_ids[0]
             logger.info(f"Account ID: {self.account_id}")
         else:
             logger.warning("No account found on 01 Exchange!")
 
-        # Create session
-        self._create_session()
+        # Create session (or resume a persisted one that hasn't expired)
+        if not await self._try_resume_session():
+            await self._create_session()
+
+    async def close(self):
+        """Release the HTTP session."""
+        if self._session is not None:
+            try:
+                await self._session.aclose()
+            except Exception:
+                pass
+            self._session = None
+
+    async def _get_server_timestamp(self) -> int:
+        """Server time in seconds, extrapolated from a cached clock offset.
+
+        The real /timestamp GET only happens every ~30s; in between, local
+        wall-clock plus the last measured offset is accurate to well under
+        the session/expiry tolerances, and the hot order path saves an RTT.
+        """
+        if (
+            self._clock_offset is not None
+            and time.monotonic() - self._clock_synced_at < 30
+        ):
+            return int(time.time() + self._clock_offset)
 
-    def _get_server_timestamp(self) -> int:
-        resp = requests.get(f"{self.api_url}/timestamp")
+        resp = await self._http().get("/timestamp")
         resp.raise_for_status()
-        return int(resp.json())
+        server_ts = int(_loads(resp.content))
+        self._clock_offset = server_ts - time.time()
+        self._clock_synced_at = time.monotonic()
+        return server_ts
+
+    @staticmethod
+    def _serialize_and_sign(action, signing_key, sign_func) -> bytes:
+        """Build the signed wire payload for an Action (runs off-loop)."""
+        payload = action.SerializeToString()
+        message = get_varint_bytes(len(payload)) + payload
+        return message + sign_func(signing_key, message)
 
-    def _execute_action(self, action, signing_key, sign_func) -> "schema_pb2.Receipt":
+    async def _execute_action(self, action, signing_key, sign_func) -> "schema_pb2.Receipt":
         """Serialize, sign, and send an Action. Returns parsed Receipt."""
-        payload = action.SerializeToString()
-        length_prefix = get_varint_bytes(len(payload))
-        message = length_prefix + payload
-        signature = sign_func(signing_key, message)
+        # Serialize + sign in one worker-thread hop so a hot reprice burst
+        # can't stall other coroutines behind the protobuf/Ed25519 work
+        body = await asyncio.to_thread(
+            self._serialize_and_sign, action, signing_key, sign_func
+        )
 
-        resp = requests.post(
-            f"{self.api_url}/action",
-            data=message + signature,
+        resp = await self._http().post(
+            "/action",
+            content=body,
             headers={"Content-Type": "application/octet-stream"},
         )
 
@@ -117,13 +293,13 @@ class Exchange01Client:
 
         if receipt.HasField("err"):
             error_name = schema_pb2.Error.Name(receipt.err)
-            raise Exception(f"Action failed: {error_name}")
+            raise _error_type(error_name)(f"Action failed: {error_name}")
 
         return receipt
 
-    def _create_session(self):
+    async def _create_session(self):
         """Create a trading session (expires in SESSION_DURATION_S)."""
-        server_time = self._get_server_timestamp()
+        server_time = await self._get_server_timestamp()
 
         self.session_signkey = Ed25519PrivateKey.generate()
         session_pubkey = self.session_signkey.public_key().public_bytes_raw()
@@ -131,33 +307,85 @@ class Exchange01Client:
         action = schema_pb2.Action()
         action.current_timestamp = server_time
         action.nonce = 0
-        action.create_session.user_pubkey = (
-            self.user_signkey.public_key().public_bytes_raw()
-        )
+        action.create_session.user_pubkey = self._user_pubkey_bytes
         action.create_session.session_pubkey = session_pubkey
         action.create_session.expiry_timestamp = (
             server_time + config.SESSION_DURATION_S
         )
 
-        receipt = self._execute_action(action, self.user_signkey, user_sign)
+        receipt = await self._execute_action(action, self.user_signkey, user_sign)
         self.session_id = receipt.create_session_result.session_id
         self.session_expiry = server_time + config.SESSION_DURATION_S
         self._nonce = 0
+        self._build_templates()
+        self._save_session()
 
         logger.info(f"Session created (ID: {self.session_id})")
 
-    def _ensure_session(self):
+    def _save_session(self):
+        """Persist session key/id so restarts can skip CreateSession."""
+        try:
+            os.makedirs(os.path.dirname(_SESSION_FILE), exist_ok=True)
+            with open(_SESSION_FILE, "w") as f:
+                json.dump({
+                    "session_id": self.session_id,
+                    "session_key_hex": self.session_signkey.private_bytes_raw().hex(),
+                    "expiry": self.session_expiry,
+                }, f)
+            os.chmod(_SESSION_FILE, 0o600)  # file holds a private key
+        except OSError as e:
+            logger.debug(f"Could not persist session: {e}")
+
+    async def _try_resume_session(self) -> bool:
+        """Reuse a persisted session if it has comfortable life left."""
+        try:
+            with open(_SESSION_FILE) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        try:
+            server_time = await self._get_server_timestamp()
+            if server_time >= data["expiry"] - 120:
+                return False
+            self.session_signkey = Ed25519PrivateKey.from_private_bytes(
+                bytes.fromhex(data["session_key_hex"])
+            )
+            self.session_id = data["session_id"]
+            self.session_expiry = data["expiry"]
+            # Nonce only disambiguates actions sharing a timestamp; jump well
+            # past anything the previous process could have used.
+            self._nonce = 100_000
+            self._build_templates()
+            logger.info(f"Resumed session from cache (ID: {self.session_id})")
+            return True
+        except (KeyError, ValueError) as e:
+            logger.debug(f"Stale session cache ignored: {e}")
+            return False
+
+    def _build_templates(self):
+        """(Re)build the per-session Action templates for the hot paths."""
+        tmpl = schema_pb2.Action()
+        tmpl.place_order.session_id = self.session_id
+        tmpl.place_order.market_id = config.O1_MARKET_ID
+        self._order_tmpl = tmpl
+
+        tmpl = schema_pb2.Action()
+        tmpl.atomic.session_id = self.session_id
+        self._atomic_tmpl = tmpl
+
+    async def _ensure_session(self):
         """Refresh session if expired or about to expire (60s buffer)."""
-        now = self._get_server_timestamp()
+        now = await self._get_server_timestamp()
         if now >= self.session_expiry - 60:
             logger.info("Session expiring, refreshing...")
-            self._create_session()
+            await self._create_session()
 
-    def _fetch_market_info(self) -> dict:
+    async def _fetch_market_info(self) -> dict:
         """Fetch all market metadata from /info."""
-        resp = requests.get(f"{self.api_url}/info")
+        resp = await self._http().get("/info")
         resp.raise_for_status()
-        info = resp.json()
+        info = _loads(resp.content)
 
         markets = {}
         for m in info["markets"]:
@@ -175,7 +403,7 @@ class Exchange01Client:
 
     # ─── Order Management ────────────────────────────────────────────────────
 
-    def place_limit_order(
+    async def place_limit_order(
         self, side: str, price: float, size: float, post_only: bool = False
     ) -> int | None:
         """
@@ -188,28 +416,22 @@ class Exchange01Client:
             logger.info(f"[DRY RUN] Place {side} {size:.6f} @ ${price:.1f} (PostOnly={post_only})")
             return None
 
-        self._ensure_session()
-        m = self.market_info[config.O1_MARKET_ID]
-        price_raw = int(price * (10 ** m["price_decimals"]))
-        size_raw = int(size * (10 ** m["size_decimals"]))
+        await self._ensure_session()
+        price_raw = int(price * self._price_scale)
+        size_raw = int(size * self._size_scale)
 
-        server_time = self._get_server_timestamp()
+        server_time = await self._get_server_timestamp()
         self._nonce += 1
         action = schema_pb2.Action()
+        action.CopyFrom(self._order_tmpl)
         action.current_timestamp = server_time
         action.nonce = self._nonce
-        action.place_order.session_id = self.session_id
-        action.place_order.market_id = config.O1_MARKET_ID
-        action.place_order.side = (
-            schema_pb2.Side.BID if side == "bid" else schema_pb2.Side.ASK
-        )
-        action.place_order.fill_mode = (
-            schema_pb2.FillMode.POST_ONLY if post_only else schema_pb2.FillMode.LIMIT
-        )
+        action.place_order.side = _SIDE_MAP[side]
+        action.place_order.fill_mode = _FM_POST_ONLY if post_only else _FM_LIMIT
         action.place_order.price = price_raw
         action.place_order.size = size_raw
 
-        receipt = self._execute_action(action, self.session_signkey, session_sign)
+        receipt = await self._execute_action(action, self.session_signkey, session_sign)
         result = receipt.place_order_result
 
         if result.HasField("posted"):
@@ -223,14 +445,14 @@ class Exchange01Client:
 
         return None
 
-    def cancel_order(self, order_id: int):
+    async def cancel_order(self, order_id: int):
         """Cancel an order by ID."""
         if config.DRY_RUN:
             logger.info(f"[DRY RUN] Cancel order {order_id}")
             return
 
-        self._ensure_session()
-        server_time = self._get_server_timestamp()
+        await self._ensure_session()
+        server_time = await self._get_server_timestamp()
 
         self._nonce += 1
         action = schema_pb2.Action()
@@ -239,10 +461,33 @@ class Exchange01Client:
         action.cancel_order_by_id.session_id = self.session_id
         action.cancel_order_by_id.order_id = order_id
 
-        self._execute_action(action, self.session_signkey, session_sign)
+        await self._execute_action(action, self.session_signkey, session_sign)
         logger.debug(f"Cancelled order {order_id}")
 
-    def atomic_cancel_and_place(
+    async def cancel_orders(self, order_ids: list[int]):
+        """Cancel several orders in one signed atomic request (max 4)."""
+        if not order_ids:
+            return
+        if config.DRY_RUN:
+            logger.info(f"[DRY RUN] Cancel orders {order_ids}")
+            return
+
+        await self._ensure_session()
+        server_time = await self._get_server_timestamp()
+
+        self._nonce += 1
+        action = schema_pb2.Action()
+        action.CopyFrom(self._atomic_tmpl)
+        action.current_timestamp = server_time
+        action.nonce = self._nonce
+        for oid in order_ids:
+            sub = action.atomic.actions.add()
+            sub.cancel_order.order_id = oid
+
+        await self._execute_action(action, self.session_signkey, session_sign)
+        logger.debug(f"Cancelled orders {order_ids}")
+
+    async def atomic_cancel_and_place(
         self, cancel_ids: list[int], new_orders: list[dict]
     ) -> list[int]:
         """
@@ -255,15 +500,14 @@ class Exchange01Client:
                 logger.info(f"[DRY RUN] Atomic: {o['side']} {o['size']:.6f} @ ${o['price']:.1f}")
             return []
 
-        self._ensure_session()
-        m = self.market_info[config.O1_MARKET_ID]
-        server_time = self._get_server_timestamp()
+        await self._ensure_session()
+        server_time = await self._get_server_timestamp()
 
         self._nonce += 1
         action = schema_pb2.Action()
+        action.CopyFrom(self._atomic_tmpl)
         action.current_timestamp = server_time
         action.nonce = self._nonce
-        action.atomic.session_id = self.session_id
 
         # Cancels first (required ordering for same market)
         for oid in cancel_ids:
@@ -272,23 +516,21 @@ class Exchange01Client:
 
         # Then place new orders
         for order in new_orders:
-            price_raw = int(order["price"] * (10 ** m["price_decimals"]))
-            size_raw = int(order["size"] * (10 ** m["size_decimals"]))
+            price_raw = int(order["price"] * self._price_scale)
+            size_raw = int(order["size"] * self._size_scale)
             is_post_only = order.get("post_only", False)
 
             sub = action.atomic.actions.add()
             sub.trade_or_place.market_id = config.O1_MARKET_ID
-            sub.trade_or_place.order_type.side = (
-                schema_pb2.Side.BID if order["side"] == "bid" else schema_pb2.Side.ASK
-            )
+            sub.trade_or_place.order_type.side = _SIDE_MAP[order["side"]]
             sub.trade_or_place.order_type.fill_mode = (
-                schema_pb2.FillMode.POST_ONLY if is_post_only else schema_pb2.FillMode.LIMIT
+                _FM_POST_ONLY if is_post_only else _FM_LIMIT
             )
             sub.trade_or_place.order_type.is_reduce_only = False
             sub.trade_or_place.limit.price = price_raw
             sub.trade_or_place.limit.size = size_raw
 
-        receipt = self._execute_action(action, self.session_signkey, session_sign)
+        receipt = await self._execute_action(action, self.session_signkey, session_sign)
 
         # Extract new order IDs from atomic result
         new_ids = []
@@ -308,24 +550,39 @@ class Exchange01Client:
         )
         return new_ids
 
+    async def snapshot(self) -> tuple[tuple[float, float], dict, float]:
+        """Fetch (bbo, balance, position) concurrently — one RTT, not three."""
+        bbo, balance, position = await asyncio.gather(
+            self.get_best_bid_ask(), self.get_balance(), self.get_position()
+        )
+        return bbo, balance, position
+
     # ─── Market Data ─────────────────────────────────────────────────────────
 
-    def get_orderbook(self) -> dict:
+    async def get_orderbook(self) -> dict:
         """Fetch orderbook for configured market."""
-        resp = requests.get(
-            f"{self.api_url}/market/{config.O1_MARKET_ID}/orderbook",
-        )
+        resp = await self._http().get(f"/market/{config.O1_MARKET_ID}/orderbook")
         resp.raise_for_status()
-        return resp.json()
-
-    def get_best_bid_ask(self) -> tuple[float, float]:
-        """Return (best_bid, best_ask) from 01 orderbook."""
-        book = self.get_orderbook()
+        return _loads(resp.content)
+
+    async def get_best_bid_ask(self, force: bool = False) -> tuple[float, float]:
+        """Return (best_bid, best_ask) from 01 orderbook, cached briefly."""
+        if (
+            not force
+            and self._bid > 0
+            and time.monotonic() - self._bbo_ts < self.BBO_MAX_AGE_S
+        ):
+            return (self._bid, self._ask)
+
+        book = await self.get_orderbook()
         best_bid = float(book["bids"][0][0]) if book["bids"] else 0.0
         best_ask = float(book["asks"][0][0]) if book["asks"] else 0.0
+        if best_bid > 0 and best_ask > 0:
+            self._bid, self._ask = best_bid, best_ask
+            self._bbo_ts = time.monotonic()
         return best_bid, best_ask
 
-    def get_balance(self) -> dict:
+    async def get_balance(self) -> dict:
         """
         Fetch account balance/collateral info via GET /account/{id}.
         Returns dict with collateral, free_collateral, equity.
@@ -334,9 +591,9 @@ class Exchange01Client:
             return {"collateral": 0.0, "free_collateral": 0.0, "equity": 0.0}
 
         try:
-            resp = requests.get(f"{self.api_url}/account/{self.account_id}")
+            resp = await self._http().get(f"/account/{self.account_id}")
             resp.raise_for_status()
-            data = resp.json()
+            data = _loads(resp.content)
 
             # Updated parsing: equity from Balances, free from Margins
             balances = data.get("balances", [])
@@ -355,7 +612,7 @@ class Exchange01Client:
             logger.error(f"Balance fetch error: {e}")
             return {"collateral": 0.0, "free_collateral": 0.0, "equity": 0.0}
 
-    def get_position(self) -> float:
+    async def get_position(self) -> float:
         """
         Fetch current BTC position via GET /account/{id}.
         Returns: positive = long, negative = short, 0 = flat.
@@ -364,9 +621,9 @@ class Exchange01Client:
             return 0.0
 
         try:
-            resp = requests.get(f"{self.api_url}/account/{self.account_id}")
+            resp = await self._http().get(f"/account/{self.account_id}")
             resp.raise_for_status()
-            data = resp.json()
+            data = _loads(resp.content)
 
             for pos in data.get("positions", []):
                 if pos.get("marketId") == config.O1_MARKET_ID:
@@ -387,8 +644,8 @@ class Exchange01Client:
             logger.error(f"Position fetch error: {e}")
             return 0.0
 
-    def get_market_stats(self) -> dict:
+    async def get_market_stats(self) -> dict:
         """Fetch market stats (mark price, funding, etc.)."""
-        resp = requests.get(f"{self.api_url}/market/{config.O1_MARKET_ID}/stats")
+        resp = await self._http().get(f"/market/{config.O1_MARKET_ID}/stats")
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
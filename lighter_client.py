@@ -3,18 +3,42 @@ Lighter DEX Client — Taker Hedge Orders
 Uses lighter-sdk (pip install lighter-sdk, imports as 'lighter').
 """
 
+import asyncio
+import itertools
 import logging
-import random
-from decimal import Decimal
+import time
+
+try:
+    import lighter
+except ImportError:  # surfaced with a hint in initialize()
+    lighter = None
 
 import config
 
 logger = logging.getLogger(__name__)
 
+# BTC sizes are sent in smallest units (5 decimal places). Sizes this bot
+# trades (μBTC granularity) are exact in float64, so plain integer rounding
+# replaces the old Decimal round-trip.
+_BASE_AMOUNT_SCALE = 100000
+
+# Idempotency tokens for orders: time-seeded so ids never collide across
+# restarts, monotonic so generating one is a lock-free next() instead of a
+# random.randint bias-rejection loop.
+_client_oid_counter = itertools.count(int(time.time()) * 1000)
+
 
 class LighterClient:
     """Client for Lighter DEX using official Python SDK (lighter-sdk)."""
 
+    # How long a cached BBO stays servable before we refetch. Callers that
+    # need a guaranteed-fresh quote pass force=True.
+    BBO_MAX_AGE_S = 2.0
+
+    # Same idea for the account position (invalidated whenever we send an
+    # order, since our own fills are what move it).
+    POS_MAX_AGE_S = 2.0
+
     def __init__(self):
         self.api_url = config.LIGHTER_API_URL
         self.api_key_private_key = config.LIGHTER_API_KEY_PRIVATE_KEY
@@ -23,18 +47,45 @@ class LighterClient:
         self.signer = None       # SignerClient for orders
         self.api_client = None   # ApiClient for data
         self.order_api = None    # OrderApi for orderbook
+        self.account_api = None  # AccountApi for position/balance
+
+        # Mid-price tick stream: a background task refreshes the BBO and
+        # wakes any coroutine waiting on tick_event, so consumers don't
+        # each poll the orderbook endpoint themselves.
+        self.last_mid: float = 0.0
+        self.tick_event = asyncio.Event()
+        self._tick_task: asyncio.Task | None = None
+
+        # Last observed BBO — served to callers within BBO_MAX_AGE_S so
+        # bursts of get_best_bid_ask calls don't each pay a round-trip.
+        self._bid: float = 0.0
+        self._ask: float = 0.0
+        self._bbo_ts: float = 0.0
+
+        # Last observed position (no user-fills stream on this integration,
+        # so the cache only dedupes read bursts within POS_MAX_AGE_S).
+        self._pos: float = 0.0
+        self._pos_ts: float = 0.0
+
+        # Raw account response shared by get_position/get_balance — the two
+        # hit the same endpoint back-to-back, so one fetch+decode serves both.
+        self._account_cache = None
+        self._account_cache_ts: float = 0.0
 
     async def initialize(self):
         """Initialize Lighter API and Signer clients."""
         logger.info(f"Initializing Lighter client at {self.api_url}...")
 
-        try:
-            import lighter
+        if lighter is None:
+            logger.error("Lighter SDK not found. Run: pip install lighter-sdk")
+            raise ImportError("lighter-sdk is not installed")
 
+        try:
             # Data client (async — must be created in event loop)
             api_config = lighter.Configuration(host=self.api_url)
             self.api_client = lighter.ApiClient(configuration=api_config)
             self.order_api = lighter.OrderApi(self.api_client)
+            self.account_api = lighter.AccountApi(self.api_client)
 
             # Signing client (for placing orders)
             if self.api_key_private_key:
@@ -56,15 +107,28 @@ class LighterClient:
             logger.info(f"Lighter ready. BTC BBO: ${bbo[0]:,.1f} / ${bbo[1]:,.1f}")
             return True
 
-        except ImportError:
-            logger.error("Lighter SDK not found. Run: pip install lighter-sdk")
-            raise
         except Exception as e:
             logger.error(f"Lighter init failed: {e}")
             raise
 
+    def start_tick_stream(self, interval_s: float = 15.0):
+        """Start the background mid-price tick task (idempotent)."""
+        if self._tick_task is None or self._tick_task.done():
+            self._tick_task = asyncio.create_task(self._tick_loop(interval_s))
+
+    async def _tick_loop(self, interval_s: float):
+        while True:
+            bid, ask = await self.get_best_bid_ask()
+            if bid > 0 and ask > 0:
+                self.last_mid = (bid + ask) / 2
+                self.tick_event.set()
+            await asyncio.sleep(interval_s)
+
     async def close(self):
         """Cleanup resources."""
+        if self._tick_task:
+            self._tick_task.cancel()
+            self._tick_task = None
         if self.api_client:
             try:
                 await self.api_client.close()
@@ -76,18 +140,29 @@ class LighterClient:
             except Exception:
                 pass
 
-    async def get_best_bid_ask(self) -> tuple[float, float]:
-        """Return (best_bid, best_ask) from Lighter orderbook."""
+    async def get_best_bid_ask(self, force: bool = False) -> tuple[float, float]:
+        """Return (best_bid, best_ask), cached for up to BBO_MAX_AGE_S."""
         if not self.order_api:
             return (0.0, 0.0)
 
+        if (
+            not force
+            and self._bid > 0
+            and time.monotonic() - self._bbo_ts < self.BBO_MAX_AGE_S
+        ):
+            return (self._bid, self._ask)
+
         try:
+            # Only the top of book is ever read — don't fetch/decode depth
             ob = await self.order_api.order_book_orders(
-                market_id=config.LIGHTER_MARKET_ID, limit=5
+                market_id=config.LIGHTER_MARKET_ID, limit=1
             )
 
             best_bid = float(ob.bids[0].price) if ob.bids else 0.0
             best_ask = float(ob.asks[0].price) if ob.asks else 0.0
+            if best_bid > 0 and best_ask > 0:
+                self._bid, self._ask = best_bid, best_ask
+                self._bbo_ts = time.monotonic()
             return (best_bid, best_ask)
 
         except Exception as e:
@@ -115,18 +190,19 @@ class LighterClient:
         try:
             is_ask = side.upper() == "SELL"
 
-            # Get current market price for slippage calc
-            best_bid, best_ask = await self.get_best_bid_ask()
+            # Get current market price for slippage calc — always fresh:
+            # a cached quote up to BBO_MAX_AGE_S old would shift the
+            # slippage cap by however far the market moved since.
+            best_bid, best_ask = await self.get_best_bid_ask(force=True)
             if best_bid == 0 or best_ask == 0:
                 logger.error("Cannot fetch Lighter market price — aborting hedge")
                 return (None, 0.0)
 
             # base_amount: integer in smallest units (5 decimal places for BTC)
-            size_dec = Decimal(str(size))
-            base_amount = int(size_dec * Decimal("100000"))
+            base_amount = round(size * _BASE_AMOUNT_SCALE)
 
             # avg_execution_price: integer with 1 decimal removed
-            # e.g. $68856.1 → int("688561") = 688561
+            # e.g. $68856.1 → 688561
             buffer_mult = slippage_bps / 10000.0
             if is_ask:
                 market_price = best_bid
@@ -135,13 +211,12 @@ class LighterClient:
                 market_price = best_ask
                 target_price = best_ask * (1.0 + buffer_mult)
 
-            price_str = f"{target_price:.1f}"
-            avg_execution_price = int(price_str.replace(".", ""))
+            avg_execution_price = round(target_price * 10)
 
             position_value = size * market_price
             
-            # Use custom ID if provided, else random
-            client_oid = custom_id if custom_id else random.randint(1_000_000, 999_999_999)
+            # Use custom ID if provided, else the next counter value
+            client_oid = custom_id if custom_id is not None else next(_client_oid_counter)
             
             logger.info(
                 f"=== HEDGE ORDER (ID: {client_oid}) ===\n"
@@ -165,27 +240,43 @@ class LighterClient:
             tx_hash = getattr(response, "tx_hash", "unknown")
             logger.info(f"  ✅ Hedge sent! TX: {str(tx_hash)[:16]}...")
             logger.info(f"===================")
+            self._pos_ts = 0.0  # our fill moves the position — drop the caches
+            self._account_cache_ts = 0.0
             return (response, market_price)
 
         except Exception as e:
             logger.error(f"Lighter order failed: {e}", exc_info=True)
             return (None, 0.0)
 
-    async def get_position(self) -> float:
+    async def _get_account(self, max_age: float = 0.5, force: bool = False):
+        """Fetch the raw account response, memoized for back-to-back reads."""
+        if (
+            not force
+            and self._account_cache is not None
+            and time.monotonic() - self._account_cache_ts < max_age
+        ):
+            return self._account_cache
+
+        account = await self.account_api.account(
+            by="index", value=str(self.account_index)
+        )
+        self._account_cache = account
+        self._account_cache_ts = time.monotonic()
+        return account
+
+    async def get_position(self, force: bool = False) -> float:
         """
-        Fetch current BTC position on Lighter.
+        Fetch current BTC position on Lighter (cached for POS_MAX_AGE_S).
         Returns: positive = long, negative = short, 0 = flat.
         """
-        try:
-            import lighter
+        if not force and time.monotonic() - self._pos_ts < self.POS_MAX_AGE_S:
+            return self._pos
 
-            api_config = lighter.Configuration(host=self.api_url)
-            api_client = lighter.ApiClient(configuration=api_config)
-            account_api = lighter.AccountApi(api_client)
+        if not self.account_api:
+            return 0.0
 
-            account = await account_api.account(
-                by="index", value=str(self.account_index)
-            )
+        try:
+            account = await self._get_account(force=force)
 
             if hasattr(account, "accounts") and account.accounts:
                 acct = account.accounts[0]
@@ -207,10 +298,12 @@ class LighterClient:
                             
                             logger.info(f"Fetched Lighter Position: {final_size} (Raw: {raw_size}, Sign: {sign})")
 
-                            await api_client.close()
+                            self._pos = final_size
+                            self._pos_ts = time.monotonic()
                             return final_size
 
-            await api_client.close()
+            self._pos = 0.0
+            self._pos_ts = time.monotonic()
             return 0.0
 
         except Exception as e:
@@ -222,18 +315,12 @@ class LighterClient:
         Fetch account balance/collateral info from Lighter.
         Returns dict with collateral and equity.
         """
-        try:
-            import lighter
-
-            api_config = lighter.Configuration(host=self.api_url)
-            api_client = lighter.ApiClient(configuration=api_config)
-            account_api = lighter.AccountApi(api_client)
-
-            account = await account_api.account(
-                by="index", value=str(self.account_index)
-            )
+        result = {"collateral": 0.0, "equity": 0.0, "free_collateral": 0.0}
+        if not self.account_api:
+            return result
 
-            result = {"collateral": 0.0, "equity": 0.0, "free_collateral": 0.0}
+        try:
+            account = await self._get_account()
 
             if hasattr(account, "accounts") and account.accounts:
                 acct = account.accounts[0]
@@ -245,9 +332,15 @@ class LighterClient:
                     getattr(acct, "freeCollateral", result["collateral"])) or 0
                 )
 
-            await api_client.close()
             return result
 
         except Exception as e:
             logger.error(f"Lighter balance fetch error: {e}")
             return {"collateral": 0.0, "equity": 0.0, "free_collateral": 0.0}
+
+    async def snapshot(self) -> tuple[tuple[float, float], dict, float]:
+        """Fetch (bbo, balance, position) concurrently — one RTT, not three."""
+        bbo, balance, position = await asyncio.gather(
+            self.get_best_bid_ask(), self.get_balance(), self.get_position()
+        )
+        return bbo, balance, position
@@ -4,6 +4,7 @@ Delta neutral volume farming bot for 01 Exchange + Lighter DEX.
 """
 
 import asyncio
+import atexit
 import logging
 import sys
 
@@ -28,15 +29,28 @@ def setup_logging():
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("telegram").setLevel(logging.WARNING)
 
-    # Rotating File Handler: Max 5MB per file, keep 2 backups (~15MB total)
-    from logging.handlers import RotatingFileHandler
+    # Rotating File Handler: Max 5MB per file, keep 2 backups (~15MB total).
+    # Note: %f is not a strftime token — milliseconds come from %(msecs)03d,
+    # which keeps logging on its fast default formatTime path.
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+    import queue
+
     fh = RotatingFileHandler("cycle_farmer.log", maxBytes=5*1024*1024, backupCount=2)
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(logging.Formatter(
-        "%(asctime)s  |  %(levelname)-8s  |  %(message)s",
-        datefmt="%Y/%m/%d %H:%M:%S.%f",
+        "%(asctime)s.%(msecs)03d  |  %(levelname)-8s  |  %(message)s",
+        datefmt="%Y/%m/%d %H:%M:%S",
     ))
-    logging.getLogger().addHandler(fh)
+
+    # File writes (and rollovers) happen on a listener thread, not the
+    # event-loop thread that emits the record.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, fh, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued before the interpreter exits —
+    # the crash/shutdown tail is exactly what the file log is for.
+    atexit.register(listener.stop)
+    logging.getLogger().addHandler(QueueHandler(log_queue))
 
 
 def validate_config():
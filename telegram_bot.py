@@ -4,57 +4,157 @@ import asyncio
 import time
 from telegram import Update
 from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler
+from telegram.request import HTTPXRequest
 import config
 import config_manager
 
 logger = logging.getLogger(__name__)
 
+# /balance reply body, formatted in one pass instead of ~15 per-line
+# f-string concatenations.
+# Static part of the /help reply — only the settings list appended at
+# call time is dynamic (and that's cached by config_manager).
+_HELP_PREFIX = (
+    "🤖 **COMMANDS**\n"
+    "/start - Start farming\n"
+    "/stop - Stop after current phase\n"
+    "/status - Show bot state & position\n"
+    "/balance - Show wallet balances (01 + Lighter)\n"
+    "/config - Show current settings\n"
+    "/set - Change a setting (see below)\n"
+    "/help - Show this message\n\n"
+)
+
+_BAL_TMPL = (
+    "💰 **BALANCES**\n\n"
+    "**01 Exchange:**\n"
+    "  💵 Collateral: `${coll_01:,.2f}`\n"
+    "  🆓 Free: `${free_01:,.2f}`\n"
+    "  📉 Equity: `${eq_01:,.2f}`\n"
+    "  📈 **Session PnL: {pnl_01}**\n"
+    "  🟠 Position: `{pos_01:.5f} BTC`\n\n"
+    "**Lighter DEX:**\n"
+    "  💵 Collateral: `${coll_lighter:,.2f}`\n"
+    "  🆓 Free: `${free_lighter:,.2f}`\n"
+    "  📉 Equity: `${eq_lighter:,.2f}`\n"
+    "  📈 **Session PnL: {pnl_lighter}**\n"
+    "  🟠 Position: `{pos_lighter:.5f} BTC`\n"
+)
+
 class TelegramBot:
+
+    # How long a fetched position/balance snapshot keeps serving /status
+    # and /balance spam before we pay another round-trip.
+    SNAPSHOT_TTL_S = 1.5
+
+    # Alerts queued within this window are concatenated into one message,
+    # and sends are spaced to stay under Telegram's 30 msg/s bot-wide cap.
+    ALERT_COALESCE_S = 0.2
+    ALERT_MIN_INTERVAL_S = 1 / 25
+
+    # State Icon Map — shared across instances, so the icon lookup and the
+    # default "icon + state" strings are built once at class creation.
+    STATE_EMOJIS = {
+        "IDLE": "💤",
+        "OPENING": "🟢",
+        "HEDGING": "🛡️",
+        "HOLDING": "⏳",
+        "CLOSING": "🔴",
+        "UNWINDING": "🔄",
+        "COOLDOWN": "❄️",
+        "PAUSED": "⏸️",
+    }
+    STATE_DISPLAY = {k: f"{v} {k}" for k, v in STATE_EMOJIS.items()}
+
+    # Countdown line per timed state: (start attr, duration attr, template)
+    _COUNTDOWNS = {
+        "HOLDING": ("hold_start_time", "hold_duration_s", "⏳ Wait: `{}m {}s`"),
+        "COOLDOWN": (
+            "cooldown_start_time", "cooldown_duration_s",
+            "⏳ Cooldown: `{}m {}s` remaining",
+        ),
+    }
+
     def __init__(self, farmer):
         self.farmer = farmer
         self.app = None
+        self._stop_event = asyncio.Event()
+
+        # Outbound alerts go through a queue so a burst of events becomes
+        # one API call instead of one per alert. Bounded so a wedged sender
+        # can't grow it forever — dropping an alert beats leaking memory.
+        self._alert_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self._alert_task: asyncio.Task | None = None
+
+        # Snapshot caches, each guarded by a lock so a burst of concurrent
+        # commands collapses into a single exchange fetch.
+        self._pos_cache: tuple[float, float] | None = None   # (ts, pos)
+        self._pos_lock = asyncio.Lock()
+        self._bal_cache: tuple[float, tuple] | None = None   # (ts, payload)
+        self._bal_lock = asyncio.Lock()
+
+        # Parsed once so auth is an int compare, not a str() per command
+        self._allowed_uid = (
+            int(config.TELEGRAM_ALLOWED_CHAT_ID)
+            if config.TELEGRAM_ALLOWED_CHAT_ID else None
+        )
 
-        # State Icon Map
-        self.STATE_EMOJIS = {
-            "IDLE": "💤",
-            "OPENING": "🟢",
-            "HEDGING": "🛡️",
-            "HOLDING": "⏳",
-            "CLOSING": "🔴",
-            "UNWINDING": "🔄",
-            "COOLDOWN": "❄️",
-            "PAUSED": "⏸️",
-        }
-        
         if not config.TELEGRAM_BOT_TOKEN:
             logger.warning("⚠️ No TELEGRAM_BOT_TOKEN found in .env — Bot disabled")
             return
 
-        self.app = ApplicationBuilder().token(config.TELEGRAM_BOT_TOKEN).build()
-        
+        # concurrent_updates lets independent commands run as parallel
+        # tasks instead of queueing behind whichever handler is awaiting.
+        # The default send pool holds 1 connection, which would serialize
+        # those parallel replies again — give the bot-API client a real pool.
+        self.app = (
+            ApplicationBuilder()
+            .token(config.TELEGRAM_BOT_TOKEN)
+            .request(HTTPXRequest(connection_pool_size=16))
+            .concurrent_updates(True)
+            .build()
+        )
+
         # Wire up alert callback so farmer can push notifications
         self.farmer.alert_callback = self.send_alert
-        
-        # Register commands
+
+        # Register commands (the slow, fetch-heavy ones dispatch non-blocking)
         self.app.add_handler(CommandHandler("start", self.cmd_start))
         self.app.add_handler(CommandHandler("stop", self.cmd_stop))
-        self.app.add_handler(CommandHandler("status", self.cmd_status))
-        self.app.add_handler(CommandHandler("balance", self.cmd_balance))
+        self.app.add_handler(CommandHandler("status", self.cmd_status, block=False))
+        self.app.add_handler(CommandHandler("balance", self.cmd_balance, block=False))
         self.app.add_handler(CommandHandler("config", self.cmd_config))
         self.app.add_handler(CommandHandler("set", self.cmd_set))
         self.app.add_handler(CommandHandler("help", self.cmd_help))
 
-    async def send_alert(self, message: str):
-        """Send a push alert to the configured chat."""
+    def send_alert(self, message: str):
+        """Queue a push alert to the configured chat.
+
+        Synchronous by design: callers on the trading path pay one
+        put_nowait, never a Telegram round-trip.
+        """
         if not self.app or not config.TELEGRAM_ALLOWED_CHAT_ID:
             return
         try:
-            await self.app.bot.send_message(
-                chat_id=config.TELEGRAM_ALLOWED_CHAT_ID,
-                text=message,
-            )
-        except Exception as e:
-            logger.error(f"Telegram alert failed: {e}")
+            self._alert_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(f"Alert queue full — dropping alert: {message}")
+
+    async def _alert_sender(self):
+        """Drain the alert queue: coalesce bursts, pace the API calls."""
+        while True:
+            parts = [await self._alert_queue.get()]
+            await asyncio.sleep(self.ALERT_COALESCE_S)
+            while not self._alert_queue.empty():
+                parts.append(self._alert_queue.get_nowait())
+            try:
+                await self.app.bot.send_message(
+                    chat_id=config.TELEGRAM_ALLOWED_CHAT_ID,
+                    text="\n".join(parts),
+                )
+            except Exception as e:
+                logger.error(f"Telegram alert failed: {e}")
+            await asyncio.sleep(self.ALERT_MIN_INTERVAL_S)
 
     async def run(self):
         """Run the bot polling loop."""
@@ -68,7 +168,15 @@ class TelegramBot:
             try:
                 await self.app.initialize()
                 await self.app.start()
-                await self.app.updater.start_polling()
+                # Long-poll: Telegram holds the request open up to 50s and
+                # returns the instant an update arrives, so there's no
+                # steady-state request churn. Only message updates are
+                # requested — the bot handles nothing else.
+                await self.app.updater.start_polling(
+                    timeout=50,
+                    poll_interval=0.0,
+                    allowed_updates=["message"],
+                )
                 break
             except Exception as e:
                 logger.warning(f"⚠️ Telegram init failed (attempt {attempt+1}/3): {e}")
@@ -76,22 +184,33 @@ class TelegramBot:
                     await asyncio.sleep(5)
                 else:
                     logger.error("❌ Telegram Bot failed to start — bot will run without Telegram control")
+                    # No sender task will ever drain the queue — unhook the
+                    # callback so the farmer stops queueing alerts into a void.
+                    self.farmer.alert_callback = None
                     return
         
-        # Keep running until cancelled
+        self._alert_task = asyncio.create_task(self._alert_sender())
+
+        # Park until shutdown — an Event wait never wakes the loop, unlike
+        # the old sleep(3600) heartbeat
         try:
-            while True:
-                await asyncio.sleep(3600)
+            await self._stop_event.wait()
         except asyncio.CancelledError:
-            logger.info("🤖 Telegram Bot stopping...")
-            await self.app.updater.stop()
-            await self.app.stop()
-            await self.app.shutdown()
+            pass
+        logger.info("🤖 Telegram Bot stopping...")
+        self._alert_task.cancel()
+        await self.app.updater.stop()
+        await self.app.stop()
+        await self.app.shutdown()
+
+    def request_stop(self):
+        """Ask run() to tear down and return."""
+        self._stop_event.set()
 
     def _check_auth(self, update: Update) -> bool:
         """Check if user is authorized."""
-        user_id = str(update.effective_user.id)
-        if config.TELEGRAM_ALLOWED_CHAT_ID and user_id != config.TELEGRAM_ALLOWED_CHAT_ID:
+        user_id = update.effective_user.id
+        if self._allowed_uid is not None and user_id != self._allowed_uid:
             logger.warning(f"Unauthorized access attempt from ID: {user_id}")
             return False
         return True
@@ -113,82 +232,93 @@ class TelegramBot:
 
     async def cmd_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not self._check_auth(update): return
-        
-        state = self.farmer.state
-        if not self.farmer._enabled:
-            state = "PAUSED (Finishing Cycle)" if state != "PAUSED" else "PAUSED (Idle)"
-        
-        # Add emoji prefix
-        icon = self.STATE_EMOJIS.get(self.farmer.state, "❓")
-        state_display = f"{icon} {state}"
-            
-        pos = self.farmer.o1.get_position()
-        
+
+        f = self.farmer  # ~15 reads below — local bind beats LOAD_ATTR chains
+
+        state = f.state
+        if not f._enabled:
+            # Overridden text still gets the current state's icon
+            label = "PAUSED (Finishing Cycle)" if state != "PAUSED" else "PAUSED (Idle)"
+            state_display = f"{self.STATE_EMOJIS.get(state, '❓')} {label}"
+        else:
+            state_display = self.STATE_DISPLAY.get(state, f"❓ {state}")
+
+        async with self._pos_lock:
+            now = time.monotonic()
+            if self._pos_cache and now - self._pos_cache[0] < self.SNAPSHOT_TTL_S:
+                pos = self._pos_cache[1]
+            else:
+                pos = await f.o1.get_position()
+                self._pos_cache = (time.monotonic(), pos)
+
         # Calculate USD value
         # Use open_price if active, else last known price, else 0
-        ref_price = self.farmer.open_price
-        if ref_price == 0 and self.farmer.last_cycle_stats:
-            ref_price = self.farmer.last_cycle_stats.get("price", 0)
-            
+        ref_price = f.open_price
+        if ref_price == 0 and f.last_cycle_stats:
+            ref_price = f.last_cycle_stats.get("price", 0)
+
         usd_val = abs(pos * ref_price)
         usd_str = f" (~${usd_val:,.0f})" if usd_val > 10 else ""
-        
-        # Get active orders
-        orders = []
-        if self.farmer.bid_order_id: orders.append(f"BID {self.farmer.bid_order_id}")
-        if self.farmer.ask_order_id: orders.append(f"ASK {self.farmer.ask_order_id}")
-        if self.farmer.close_order_id: orders.append(f"CLOSE {self.farmer.close_order_id}")
-        
-        msg = (
-            f"📊 **STATUS**\n"
-            f"State: `{state_display}`\n"
-            f"Position: `{pos:.5f} BTC{usd_str}`\n"
-            f"Active Orders: `{', '.join(orders) or 'None'}`\n"
-            f"Cycles: `{self.farmer.cycle_count}`\n"
+
+        # Get active orders — one filtered pass over the label/id pairs
+        pairs = (
+            ("BID", f.bid_order_id),
+            ("ASK", f.ask_order_id),
+            ("CLOSE", f.close_order_id),
         )
-        
-        # Show time remaining if holding
-        if self.farmer.state == "HOLDING":
-            try:
-                elapsed = time.time() - self.farmer.hold_start_time
-                remaining = max(0, self.farmer.hold_duration_s - elapsed)
-                rem_min = int(remaining / 60)
-                rem_sec = int(remaining % 60)
-                msg += f"⏳ Wait: `{rem_min}m {rem_sec}s`\n"
-            except Exception:
-                 pass
-        
-        # Show time remaining if cooling down
-        if self.farmer.state == "COOLDOWN":
+        orders_str = ", ".join(f"{k} {v}" for k, v in pairs if v) or "None"
+
+        # Conditional sections append to a parts list; one join at the end
+        # instead of re-concatenating the message per section.
+        parts = [
+            "📊 **STATUS**",
+            f"State: `{state_display}`",
+            f"Position: `{pos:.5f} BTC{usd_str}`",
+            f"Active Orders: `{orders_str}`",
+            f"Cycles: `{f.cycle_count}`",
+        ]
+
+        # Show time remaining for timed states (HOLDING / COOLDOWN)
+        spec = self._COUNTDOWNS.get(f.state)
+        if spec:
+            start_attr, dur_attr, tmpl = spec
             try:
-                elapsed = time.time() - self.farmer.cooldown_start_time
-                remaining = max(0, self.farmer.cooldown_duration_s - elapsed)
-                rem_min = int(remaining / 60)
-                rem_sec = int(remaining % 60)
-                msg += f"⏳ Cooldown: `{rem_min}m {rem_sec}s` remaining\n"
+                elapsed = time.monotonic() - getattr(f, start_attr)
+                remaining = max(0, getattr(f, dur_attr) - elapsed)
+                rem_min, rem_sec = divmod(int(remaining), 60)
+                parts.append(tmpl.format(rem_min, rem_sec))
             except Exception:
                  pass
-        
-        if self.farmer.last_cycle_stats:
-            ls = self.farmer.last_cycle_stats
-            msg += (
+
+        if f.last_cycle_stats:
+            ls = f.last_cycle_stats
+            parts.append(
                 f"\n**Last Cycle:**\n"
                 f"Tx: {ls['side'].upper()} {ls['size']:.4f} BTC @ ${ls['price']:,.0f}\n"
-                f"Vol: ${ls['volume_usd']:,.2f}\n"
+                f"Vol: ${ls['volume_usd']:,.2f}"
             )
-        await update.message.reply_text(msg, parse_mode="Markdown")
+        await update.message.reply_text("\n".join(parts), parse_mode="Markdown")
 
     async def cmd_balance(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not self._check_auth(update): return
         
-        # 01 Exchange Balance
-        bal_01 = self.farmer.o1.get_balance()
-        pos_01 = self.farmer.o1.get_position()
-        
-        # Lighter Balance
-        bal_lighter = await self.farmer.lighter.get_balance()
-        pos_lighter = await self.farmer.lighter.get_position()
-        
+        async with self._bal_lock:
+            now = time.monotonic()
+            if self._bal_cache and now - self._bal_cache[0] < self.SNAPSHOT_TTL_S:
+                bal_01, pos_01, bal_lighter, pos_lighter = self._bal_cache[1]
+            else:
+                # Four independent round-trips — overlap them so the reply
+                # takes max(RTT) instead of the sum.
+                bal_01, pos_01, bal_lighter, pos_lighter = await asyncio.gather(
+                    self.farmer.o1.get_balance(),
+                    self.farmer.o1.get_position(),
+                    self.farmer.lighter.get_balance(),
+                    self.farmer.lighter.get_position(),
+                )
+                self._bal_cache = (
+                    time.monotonic(), (bal_01, pos_01, bal_lighter, pos_lighter)
+                )
+
         # Calculate PnL
         pnl_01 = bal_01['equity'] - self.farmer.start_equity_01
         pnl_lighter = bal_lighter['equity'] - self.farmer.start_equity_lighter
@@ -197,21 +327,18 @@ class TelegramBot:
         pnl_01_str = f"+${pnl_01:,.2f}" if pnl_01 >= 0 else f"-${abs(pnl_01):,.2f}"
         pnl_lighter_str = f"+${pnl_lighter:,.2f}" if pnl_lighter >= 0 else f"-${abs(pnl_lighter):,.2f}"
 
-        msg = (
-            f"💰 **BALANCES**\n\n"
-            f"**01 Exchange:**\n"
-            f"  💵 Collateral: `${bal_01['collateral']:,.2f}`\n"
-            f"  🆓 Free: `${bal_01['free_collateral']:,.2f}`\n"
-            f"  📉 Equity: `${bal_01['equity']:,.2f}`\n"
-            f"  📈 **Session PnL: {pnl_01_str}**\n"
-            f"  🟠 Position: `{pos_01:.5f} BTC`\n\n"
-            f"**Lighter DEX:**\n"
-            f"  💵 Collateral: `${bal_lighter['collateral']:,.2f}`\n"
-            f"  🆓 Free: `${bal_lighter['free_collateral']:,.2f}`\n"
-            f"  📉 Equity: `${bal_lighter['equity']:,.2f}`\n"
-            f"  📈 **Session PnL: {pnl_lighter_str}**\n"
-            f"  🟠 Position: `{pos_lighter:.5f} BTC`\n"
-        )
+        msg = _BAL_TMPL.format_map({
+            "coll_01": bal_01['collateral'],
+            "free_01": bal_01['free_collateral'],
+            "eq_01": bal_01['equity'],
+            "pnl_01": pnl_01_str,
+            "pos_01": pos_01,
+            "coll_lighter": bal_lighter['collateral'],
+            "free_lighter": bal_lighter['free_collateral'],
+            "eq_lighter": bal_lighter['equity'],
+            "pnl_lighter": pnl_lighter_str,
+            "pos_lighter": pos_lighter,
+        })
         await update.message.reply_text(msg, parse_mode="Markdown")
 
     async def cmd_config(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -243,19 +370,7 @@ class TelegramBot:
     async def cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not self._check_auth(update): return
         
-        # Base commands
-        msg = (
-            "🤖 **COMMANDS**\n"
-            "/start - Start farming\n"
-            "/stop - Stop after current phase\n"
-            "/status - Show bot state & position\n"
-            "/balance - Show wallet balances (01 + Lighter)\n"
-            "/config - Show current settings\n"
-            "/set - Change a setting (see below)\n"
-            "/help - Show this message\n\n"
+        await update.message.reply_text(
+            _HELP_PREFIX + config_manager.get_help_text(),
+            parse_mode="Markdown",
         )
-        
-        # Append dynamic settings list
-        msg += config_manager.get_help_text()
-        
-        await update.message.reply_text(msg, parse_mode="Markdown")